@@ -8,20 +8,17 @@ if platform.system() == "Windows":
     myappid = "sonaris.sonaris.dummy.string"  # arbitrary string
     ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
 import click
-from dotenv import load_dotenv
 
-# Assuming create_app is defined elsewhere in your application
-from sonaris.app import create_app, signal_handler
-from sonaris.utils.log import get_logger
-
-# Configure logger
-logger = get_logger()
+# The application (and with it PyQt6) is imported inside the commands, so that
+# `--help` and shell completion do not pay for it
 
 
 def ensure_env_variables():
     """
     Ensure key environment variables are set, using default values if necessary.
     """
+    from dotenv import load_dotenv
+
     # Load the environment variables from .env file
     load_dotenv()
 
@@ -45,6 +42,10 @@ def cli():
 
 def run_application(hardware_mock,grafana):
     """Function to initialize and run the Sonaris application."""
+    from sonaris.app import create_app
+    from sonaris.utils.log import get_logger
+
+    logger = get_logger()
     args_dict = {"hardware_mock": hardware_mock,
                  "grafana": grafana}
     logger.info(args_dict)
@@ -59,6 +60,10 @@ def run_application(hardware_mock,grafana):
 @click.option("--grafana", is_flag=True, help="Start Grafana container alongside the application. Requires Docker.")
 def run(hardware_mock, grafana):
     """Run the Sonaris application."""
+    from sonaris.app import signal_handler
+    from sonaris.utils.log import get_logger
+
+    logger = get_logger()
     signal.signal(signal.SIGINT, signal_handler)
     try:
         ensure_env_variables()
@@ -41,7 +41,7 @@ from sonaris.scheduler.worker import Worker
 from sonaris.services.datasource import DataSourceService
 from sonaris.services.grafana import GrafanaService
 from sonaris.tasks.tasks import get_tasks
-from sonaris.utils.container import client, network
+from sonaris.utils.container import client
 from sonaris.utils.log import get_logger
 
 logger = get_logger()
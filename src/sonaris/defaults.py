@@ -27,33 +27,15 @@ DEFAULT_DATADIR.mkdir(parents=True, exist_ok=True)
 
 # Assuming DEFAULT_DATADIR is already a Path object
 DEFAULT_DATADIR = Path(os.getenv("DATA")) if os.getenv("DATA") else DEFAULT_DATADIR
-# Define file paths in one-liners, checking for existence and falling back to DEFAULT_DATADIR if necessary
-STATE_FILE = (
-    Path(DEFAULT_DATADIR / "state.json").exists()
-    and Path(DEFAULT_DATADIR / "state.json")
-    or (DEFAULT_DATADIR / "state.json")
-)
-TIMEKEEPER_JOBS_FILE = (
-    Path(DEFAULT_DATADIR / "jobs.json").exists()
-    and Path(DEFAULT_DATADIR / "jobs.json")
-    or (DEFAULT_DATADIR / "jobs.json")
-)
-MONITOR_FILE = (
-    Path(DEFAULT_DATADIR / "monitor.json").exists()
-    and Path(DEFAULT_DATADIR / "monitor.json")
-    or (DEFAULT_DATADIR / "monitor.json")
-)
-SETTINGS_FILE = (
-    Path(DEFAULT_DATADIR / "settings.json").exists()
-    and Path(DEFAULT_DATADIR / "settings.json")
-    or (DEFAULT_DATADIR / "settings.json")
-)
-LOG_DIR = (
-    Path(DEFAULT_DATADIR / "logs").exists()
-    and Path(DEFAULT_DATADIR / "logs")
-    or (DEFAULT_DATADIR / "logs")
-)
-LOG_DIR.mkdir(parents=True, exist_ok=True)
+# File paths under the data directory, nothing is checked on disk at import time
+STATE_FILE = DEFAULT_DATADIR / "state.json"
+TIMEKEEPER_JOBS_FILE = DEFAULT_DATADIR / "jobs.json"
+MONITOR_FILE = DEFAULT_DATADIR / "monitor.json"
+SETTINGS_FILE = DEFAULT_DATADIR / "settings.json"
+VISA_RESOURCES_FILE = DEFAULT_DATADIR / "resources.json"
+LOG_DIR = DEFAULT_DATADIR / "logs"
+# Derived data that can be rebuilt at any time, e.g. parsed experiment configs
+CACHE_DIR = DEFAULT_DATADIR / "cache"
 # UI CONFIG
 TICK_INTERVAL = 500.0  # in ms
 DECIMAL_POINTS = 5
@@ -1,9 +1,12 @@
-import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from typing import Optional, Type
 
 import pyvisa
 
 from sonaris.device.interface import EthernetInterface, Interface, USBInterface
+from sonaris.utils import log as logutils
 
 
 class Device:
@@ -42,41 +45,122 @@ class MockDevice(Device):
 
 
 class DeviceDetector:
+    # Upper bound on concurrent *IDN? probes; the queries wait on I/O, not the GIL
+    MAX_PROBE_WORKERS = 8
+    # pyvisa does not promise its resource managers are thread-safe, sessions are opened
+    # one at a time and only the queries on them run concurrently
+    _open_lock = threading.Lock()
+
     def __init__(
         self,
         resource_manager: pyvisa.ResourceManager,
         device_type: Type[Device],
+        resource_cache: Optional[Path] = None,
     ):
         self.rm = resource_manager
         self.device_type = device_type
+        # JSON file remembering the resource each device type was last found on
+        self.resource_cache = resource_cache
+        self._last_resource: Optional[str] = None
+        self._last_resource_loaded = False
 
     def detect_device(self) -> Optional[Device]:
         """
         Method that attempts to detect a device connected via TCP/IP or USB.
-        Loops through all available resources, attempting to open each one and query its identity.
-        If the device is found, it creates and returns a DG4202 instance.
+        The resource the device was last found on is tried first, only if that fails are
+        the TCP/IP and USB resources listed, opened and queried for their identity
+        concurrently. If the device is found, it creates and returns a DG4202 instance.
 
         Returns:
             A device object with the interface attached to it.
         """
-        resources = self.rm.list_resources()
-
-        for resource in resources:
-            if re.match("^TCPIP", resource):
-                try:
-                    device = self.rm.open_resource(resource)
-                    idn = device.query("*IDN?")
-                    if self.device_type.IDN_STRING in idn:
-                        return self.device_type(EthernetInterface(device))
-                except pyvisa.errors.VisaIOError:
-                    pass
-            elif re.match("^USB", resource):
-                try:
-                    device = self.rm.open_resource(resource)
-                    idn = device.query("*IDN?")
-                    if self.device_type.IDN_STRING in idn:
-                        return self.device_type(USBInterface(device))
-                except pyvisa.errors.VisaIOError:
-                    pass
-
+        last_resource = self._load_last_resource()
+        if last_resource is not None:
+            session = self._probe(last_resource)
+            if session is not None:
+                return self._create_device(last_resource, session)
+
+        candidates = [
+            resource
+            for resource in self.rm.list_resources()
+            if resource != last_resource and resource.startswith(("TCPIP", "USB"))
+        ]
+        if not candidates:
+            return None
+
+        found = None
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.MAX_PROBE_WORKERS, len(candidates))
+        )
+        try:
+            futures = {
+                executor.submit(self._probe, resource): resource
+                for resource in candidates
+            }
+            for future in as_completed(futures):
+                session = future.result()
+                if session is not None:
+                    found = futures[future], session
+                    break
+        finally:
+            # Probes not started yet are cancelled, running ones are waited for so none
+            # is still using the resource manager once this returns
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        if found is None:
+            return None
+        # Matches that completed after the first one are not used
+        for future in futures:
+            if future.cancelled() or future.exception() is not None:
+                continue
+            session = future.result()
+            if session is not None and session is not found[1]:
+                session.close()
+        self._save_last_resource(found[0])
+        return self._create_device(*found)
+
+    def _probe(self, resource: str):
+        """
+        Opens the resource and returns the session if its identity matches, the session
+        is closed otherwise.
+        """
+        if not resource.startswith(("TCPIP", "USB")):
+            return None
+        try:
+            with self._open_lock:
+                session = self.rm.open_resource(resource)
+        except (pyvisa.errors.Error, OSError, ValueError):
+            return None
+        try:
+            idn = session.query("*IDN?")
+        except pyvisa.errors.VisaIOError:
+            idn = ""
+        if self.device_type.IDN_STRING in idn:
+            return session
+        session.close()
         return None
+
+    def _create_device(self, resource: str, session) -> Device:
+        if resource.startswith("TCPIP"):
+            return self.device_type(EthernetInterface(session))
+        return self.device_type(USBInterface(session))
+
+    def _load_last_resource(self) -> Optional[str]:
+        if self.resource_cache is None:
+            return None
+        # Read once per detector, later detections reuse what was found
+        if not self._last_resource_loaded:
+            self._last_resource = logutils.load_json_with_backup(
+                self.resource_cache
+            ).get(self.device_type.__name__)
+            self._last_resource_loaded = True
+        return self._last_resource
+
+    def _save_last_resource(self, resource: str) -> None:
+        if self.resource_cache is None:
+            return
+        self._last_resource = resource
+        self._last_resource_loaded = True
+        resources = logutils.load_json_with_backup(self.resource_cache)
+        resources[self.device_type.__name__] = resource
+        logutils.save_json(resources, self.resource_cache)
@@ -2,10 +2,12 @@ import abc
 import logging
 import time
 from datetime import timedelta
-from typing import Type, Union
+from typing import Optional, Type, Union
 
 import pyvisa
 
+from sonaris.defaults import VISA_RESOURCES_FILE
+
 # Import classes and modules from sonaris.device module as needed.
 from sonaris.device.data import DataSource
 from sonaris.device.device import Device, DeviceDetector, MockDevice
@@ -28,6 +30,7 @@ class DeviceManager(abc.ABC):
         self.state_manager = state_manager
         self.args_dict = args_dict
         self.resource_manager = resource_manager
+        self.detector: Optional[DeviceDetector] = None
         self.mock_device = self.mock_device_type()
         self.setup_device()
         self.setup_data()
@@ -40,9 +43,15 @@ class DeviceManager(abc.ABC):
 
     def fetch_hardware(self) -> None:
         """Fetch and update the device driver (hardware, not simulated!)"""
-        self.device = DeviceDetector(
-            resource_manager=self.resource_manager, device_type=self.device_type
-        ).detect_device()
+        # Kept between calls, so the resource the device was last found on is only read
+        # from the cache file once and tried before any scan
+        if self.detector is None:
+            self.detector = DeviceDetector(
+                resource_manager=self.resource_manager,
+                device_type=self.device_type,
+                resource_cache=VISA_RESOURCES_FILE,
+            )
+        self.device = self.detector.detect_device()
 
     def fetch_mock_hardware(self) -> None:
         """Sets the internal pointer of device to the mock device.
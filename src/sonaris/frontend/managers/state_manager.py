@@ -16,10 +16,18 @@ logging.basicConfig(
 
 
 class StateManager:
+    """
+    Keeps the application state in a JSON file. The file is read once, under its file
+    lock, and the state is then served from memory with writes batched by the JSON write
+    buffer. This assumes a single writer: changes made to the file by another process
+    after the first read are not seen, and are overwritten by the next flush.
+    """
+
     def __init__(self, json_file: Path = None):
         self.json_file = json_file or STATE_FILE
         self.lock_file = self.json_file.with_suffix(".lock")
         self.data = self.default_state()
+        self.loaded = False
         self.birthdate = time.time()
 
     def sanitize_key(self, key: str) -> str:
@@ -29,17 +37,22 @@ class StateManager:
         return key.strip().replace(" ", "_")
 
     def read_state(self) -> dict:
-        with FileLock(self.lock_file, timeout=10):
-            # Utilize the load_json_with_backup utility function with locking
-            self.data = (
-                logutils.load_json_with_backup(self.json_file) or self.default_state()
-            )
+        if not self.loaded:
+            with FileLock(self.lock_file, timeout=10):
+                # Utilize the load_json_with_backup utility function with locking
+                self.data = (
+                    logutils.load_json_with_backup(self.json_file)
+                    or self.default_state()
+                )
+            self.loaded = True
         return self.data
 
     def write_state(self, state: dict):
-        with FileLock(self.lock_file, timeout=10):
-            self.data.update(state)
-            logutils.save_json(self.data, self.json_file)
+        self.read_state()
+        self.data.update(state)
+        logutils.json_write_buffer.set(
+            self.json_file, dict(self.data), lock_file=self.lock_file
+        )
 
     def default_state(self):
         return {}
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from typing import Callable
+from typing import Any, Callable, Optional
 
 from PyQt6 import QtCore
 from PyQt6.QtWidgets import (
@@ -24,11 +24,13 @@ logger = get_logger()
 
 
 class ExperimentConfigPopup(QDialog):
+    # Shared by every popup instance; the task dictionaries are read-only
+    task_dict = get_tasks(flatten=True)
+
     def __init__(self, timekeeper: Timekeeper, callback: Callable, parent=None):
         super().__init__(parent)
         self.timekeeper = timekeeper
         self.callback = callback
-        self.task_dict = get_tasks(flatten=True)
         self.task_enum = TaskName
         self.experiment_config = ExperimentConfiguration(
             self, self.task_dict, self.task_enum
@@ -36,10 +38,14 @@ class ExperimentConfigPopup(QDialog):
         self.initUI()
         self.showDefaultMessage()
 
+    def get_task_enum_value(self, task_str: str) -> Optional[Any]:
+        # Resolved through the Validator's cached per-enum lookup table
+        return Validator.get_task_enum_value(task_str, self.task_enum)
+
     def merge_parameters(self, parameter_list):
         merged_parameters = {}
         for parameter_dict in parameter_list:
-            merged_parameters.update(parameter_dict)
+            merged_parameters |= parameter_dict
         return merged_parameters
 
     def initUI(self):
@@ -111,22 +117,28 @@ class ExperimentConfigPopup(QDialog):
         """
         steps = self.experiment_config.getConfiguration().steps
 
+        # Check every step before scheduling any, so a bad step does not leave the
+        # experiment partially scheduled
         for step in steps:
-            step_delay = timedelta(seconds=step.delay if step.delay else 0.0)
-            task_str: str = step.task
-            parameters = step.parameters
-            task_name_str = Validator.get_task_enum_value(task_str, self.task_enum)
             # Assuming 'TaskName' can resolve both names and values to an Enum member
-            if not Validator.is_in_enum(task_str.strip(), self.task_enum):
+            if not Validator.is_in_enum(step.task.strip(), self.task_enum):
+                task_name_str = self.get_task_enum_value(step.task)
                 QMessageBox.critical(
                     self, "Error Scheduling Task", f"Unknown task: '{task_name_str}'"
                 )
                 logger.error(f"Unknown task: '{task_name_str}'")
                 return
-            schedule_time = datetime.now() + step_delay
+
+        # Step delays are relative to the moment the experiment is committed
+        now = datetime.now()
+        for step in steps:
+            task_name_str = self.get_task_enum_value(step.task)
+            schedule_time = now + timedelta(seconds=step.delay or 0.0)
             try:
                 # Schedule the task with timekeeper
-                self.timekeeper.add_job(task_name_str, schedule_time, kwargs=parameters)
+                self.timekeeper.add_job(
+                    task_name_str, schedule_time, kwargs=step.parameters
+                )
             except Exception as e:
                 QMessageBox.critical(
                     self,
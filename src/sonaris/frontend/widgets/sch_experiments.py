@@ -1,4 +1,3 @@
-import inspect
 import traceback
 from enum import Enum
 from typing import Any, Callable, Dict, List
@@ -18,14 +17,38 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from sonaris.defaults import DELAY_KEYWORD, ErrorLevel
+from sonaris.defaults import DELAY_KEYWORD, EXPERIMENT_KEYWORD, ErrorLevel
 from sonaris.frontend.widgets.ui_factory import UIComponentFactory
 from sonaris.tasks.model import Experiment, ExperimentWrapper, Task
-from sonaris.tasks.task_validator import Validator
+from sonaris.tasks.task_validator import Validator, task_signature
 from sonaris.utils.log import get_logger
+from sonaris.utils.yaml_format import SafeDumper, dump_mapping, load_yaml
 
 logger = get_logger()
 
+_EXPANDING_PREFERRED = QSizePolicy(
+    QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred
+)
+_EXPANDING_EXPANDING = QSizePolicy(
+    QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
+)
+
+
+class TaskTab(QWidget):
+    """
+    A tab holding the form of a single experiment step.
+
+    The form is built lazily by ExperimentConfiguration the first time the tab is shown.
+    Its input widgets are kept in `rows` as (parameter name, widget) pairs, so reading
+    the form back does not have to walk the layout.
+    """
+
+    def __init__(self, task: Task, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.task = task
+        self.populated = False
+        self.rows: list[tuple[str, QWidget]] = []
+
 
 class ExperimentConfiguration(QWidget):
     """
@@ -59,6 +82,9 @@ class ExperimentConfiguration(QWidget):
         self.validator = Validator(
             task_functions=self.task_functions, task_enum=self.task_enum
         )
+        # The experiment as last read back from the forms, rebuilt only after an edit
+        self._userExperiment: Experiment | None = None
+        self._userDataDirty = True
         self.initUI()
 
     def initUI(self):
@@ -97,19 +123,19 @@ class ExperimentConfiguration(QWidget):
         self.tabWidget.currentChanged.connect(self.onTabChanged)
 
         # Adjust size policies for responsive layout
-        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.tabWidget.setSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
-        )
-        self.descriptionWidget.setSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
-        )
-        self.yamlDisplayWidget.setSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
-        )
+        self.setSizePolicy(_EXPANDING_EXPANDING)
+        self.tabWidget.setSizePolicy(_EXPANDING_EXPANDING)
+        self.descriptionWidget.setSizePolicy(_EXPANDING_EXPANDING)
+        self.yamlDisplayWidget.setSizePolicy(_EXPANDING_EXPANDING)
+
+    def onTabChanged(self, index: int):
+        """Populates the tab on its first visit and updates the YAML display."""
+        self.populateTab(index)
+        self.updateYamlDisplay()
 
-    def onTabChanged(self):
-        """Updates the YAML display when the user changes tabs."""
+    def onFormChanged(self):
+        """Marks the user data as edited and updates the YAML display."""
+        self._userDataDirty = True
         self.updateYamlDisplay()
 
     def updateYamlDisplay(self):
@@ -117,23 +143,24 @@ class ExperimentConfiguration(QWidget):
             self.__updateYamlDisplay()
 
     def __updateYamlDisplay(self):
+        # Only the shown step is read back from its form, the rest of the experiment
+        # is left alone until the whole configuration is requested
         currentTabIndex = self.tabWidget.currentIndex()
-        if currentTabIndex != -1:
-            step_config = self.getUserData().steps[currentTabIndex]
-            yamlStr = yaml.dump(step_config.model_dump(), sort_keys=False)
-            self.yamlDisplayWidget.setText(yamlStr)
+        if self.experiment and 0 <= currentTabIndex < len(self.experiment.steps):
+            step_config = self._extract_task(currentTabIndex)
+            yamlStr = dump_mapping(step_config.model_dump())
+            self.yamlDisplayWidget.setPlainText(yamlStr)
 
     def loadConfiguration(self, config_path: str):
 
-        with open(config_path, "r") as file:
-            raw_dict = yaml.safe_load(file)
+        raw_dict = load_yaml(config_path)
 
         if not raw_dict:
             QMessageBox.warning(self, "Error", "No configuration loaded.")
             logger.warning(f"No configuration loaded at {config_path}.")
             return False, "No configuration loaded.", {}
 
-        raw_exp = ExperimentWrapper(**raw_dict).experiment
+        raw_exp = ExperimentWrapper.model_validate(raw_dict).experiment
         overall_valid, message_dict, highest_error_level = self.validate(raw_exp)
         descriptionText = self.errorHandling(
             overall_valid, message_dict, highest_error_level
@@ -143,6 +170,7 @@ class ExperimentConfiguration(QWidget):
         if overall_valid:
             self.__safe__ = False
             self.experiment = raw_exp
+            self._userDataDirty = True
             self.displayExperimentDetails()
             self.update()
             self.__safe__ = True
@@ -163,17 +191,18 @@ class ExperimentConfiguration(QWidget):
             validation_results = self.validator.validate_configuration(experiment)
             message_dict = {"errors": [], "warnings": [], "infos": []}
             overall_valid = True
-            highest_error_level = ErrorLevel.INFO
+            # Tracked as the plain level value, the member is looked up once at the end
+            highest_level_value = ErrorLevel.INFO.value
 
             for task_name, is_valid, message, error_level in validation_results:
                 if not is_valid:
                     overall_valid = False
                     message_dict["errors"].append(f"{task_name}: {message}")
-                    if error_level.value > highest_error_level.value:
-                        highest_error_level = error_level
-                else:
+                    highest_level_value = max(highest_level_value, error_level.value)
+                elif message:
+                    # Steps that passed without warnings have nothing to report
                     message_dict["infos"].append(f"{task_name}: {message}")
-            return overall_valid, message_dict, highest_error_level
+            return overall_valid, message_dict, ErrorLevel(highest_level_value)
         except ValidationError as e:
             self.logger.error(f"Validation error: {str(e)} {traceback.format_exc()}")
             return False, {"errors": [str(e)]}, ErrorLevel.INVALID_YAML
@@ -181,21 +210,18 @@ class ExperimentConfiguration(QWidget):
     def errorHandling(
         self, overall_valid: bool, message_dict: dict, highest_error_level: ErrorLevel
     ) -> str:
-        descriptionText = "---\n"
-
+        parts = ["---", ""]
         if message_dict["errors"]:
-            descriptionText += "\nErrors:\n" + "\n".join(message_dict["errors"])
+            parts.append("Errors:")
+            parts.extend(message_dict["errors"])
         if message_dict["warnings"]:
-            descriptionText += "\nWarnings:\n" + "\n".join(message_dict["warnings"])
-
-        infos_with_content = [
-            info
-            for info in message_dict["infos"]
-            if "Validation issues:" not in info or len(info.split(":")) > 2
-        ]
-        if infos_with_content:
-            descriptionText += "\nInformation:\n" + "\n".join(infos_with_content)
+            parts.append("Warnings:")
+            parts.extend(message_dict["warnings"])
+        if message_dict["infos"]:
+            parts.append("Information:")
+            parts.extend(message_dict["infos"])
 
+        descriptionText = "\n".join(parts)
         if overall_valid or highest_error_level == ErrorLevel.INFO:
             descriptionText = (
                 self.generate_experiment_summary(self.experiment)
@@ -222,27 +248,41 @@ class ExperimentConfiguration(QWidget):
             return
 
         self.tabWidget.clear()
-        steps = self.experiment.steps
-        if steps:
-            for index, step in enumerate(steps, start=1):
-                valid, err = self.createTaskTab(step)
-                if not valid:
-                    QMessageBox.warning(
-                        self, "Warning", f"At step {index} [{step}]:{err}"
-                    )
+        for step in self.experiment.steps:
+            self.tabWidget.addTab(
+                TaskTab(step),
+                self.validator.get_task_enum_value(step.task, self.task_enum),
+            )
+        self.populateTab(self.tabWidget.currentIndex())
         self.layout().update()
         self.__updateYamlDisplay()
 
-    def createTaskTab(self, task: Task) -> bool:
+    def populateTab(self, index: int) -> None:
         """
-        Generates a tab with a form layout for each step, allowing users to
-        interact with the step parameters.
+        Builds the form of the tab at the given index if it has not been built yet.
 
         Args:
-            task: A dictionary representing a single experiment step.
+            index: The index of the tab in the tab widget.
         """
+        tab = self.tabWidget.widget(index)
+        if tab is None or tab.populated:
+            return
+        tab.populated = True
+        valid, err = self.createTaskTab(tab)
+        if not valid:
+            QMessageBox.warning(
+                self, "Warning", f"At step {index + 1} [{tab.task}]:{err}"
+            )
+
+    def createTaskTab(self, tab: TaskTab) -> tuple[bool, str]:
+        """
+        Generates the form layout of a step tab, allowing users to
+        interact with the step parameters.
 
-        tab = QWidget()
+        Args:
+            tab: The tab of the experiment step to populate.
+        """
+        task = tab.task
         scrollArea = QScrollArea()
         scrollArea.setWidgetResizable(True)
         layout = QVBoxLayout(tab)
@@ -252,12 +292,11 @@ class ExperimentConfiguration(QWidget):
 
         delay = task.delay
         delayWidget = UIComponentFactory.create_widget(
-            DELAY_KEYWORD, delay or 0.0, float, None, lambda: self.updateYamlDisplay()
-        )
-        delayWidget.setSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred
+            DELAY_KEYWORD, delay or 0.0, float, None, lambda: self.onFormChanged()
         )
+        delayWidget.setSizePolicy(_EXPANDING_PREFERRED)
         formLayout.addRow(QLabel(f"{DELAY_KEYWORD} (s):"), delayWidget)
+        tab.rows.append((DELAY_KEYWORD, delayWidget))
         formWidget.setLayout(formLayout)
         try:
             task_function = self.get_function(task)
@@ -268,58 +307,41 @@ class ExperimentConfiguration(QWidget):
                 )
 
             # Inspect the function signature to get parameter information
-            sig = inspect.signature(task_function)
-            param_types = {
-                name: param.annotation for name, param in sig.parameters.items()
-            }
+            sig = task_signature(task_function)
             parameter_annotations = getattr(task_function, "parameter_annotations", {})
             parameter_constraints = getattr(task_function, "parameter_constraints", {})
             # Initialize a dictionary to store the task parameters from the configuration
             task_parameters = task.parameters
 
-            # trunk-ignore(ruff/B007)
             for parameter_name, param in sig.parameters.items():
                 value = task_parameters.get(parameter_name, None)
-                expected_type = param_types.get(
-                    parameter_name, str
-                )  # Defaults to string.
+                expected_type = param.annotation
                 # The units are embedded on the annotations for each parameter where applicable (if exist)
-                param_unit = (
-                    f"({parameter_annotations.get(parameter_name)})"
-                    if parameter_annotations.get(parameter_name)
-                    else ""
-                )
+                unit = parameter_annotations.get(parameter_name)
+                param_unit = f"({unit})" if unit else ""
                 # Now, extract specific constraints for the current parameter
-                specific_constraints = parameter_constraints.get(parameter_name, None)
+                specific_constraints = parameter_constraints.get(parameter_name)
 
                 widget = UIComponentFactory.create_widget(
                     parameter_name,
                     value,
                     expected_type,
                     specific_constraints,
-                    lambda: self.updateYamlDisplay(),
-                )
-                widget.setSizePolicy(
-                    QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred
+                    lambda: self.onFormChanged(),
                 )
+                widget.setSizePolicy(_EXPANDING_PREFERRED)
                 # Create labels for parameter name and type hinting (optional)
                 paramNameLabel = QLabel(
                     f"{parameter_name} :{expected_type.__name__} {param_unit}"
                 )
                 # Add labels and widget to the form layout
                 formLayout.addRow(paramNameLabel, widget)
+                tab.rows.append((parameter_name, widget))
 
             scrollArea.setWidget(formWidget)
-            self.tabWidget.addTab(
-                tab, self.validator.get_task_enum_value(task.task, self.task_enum)
-            )
             layout.addStretch(1)
-            scrollArea.setSizePolicy(
-                QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
-            )
-            tab.setSizePolicy(
-                QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
-            )
+            scrollArea.setSizePolicy(_EXPANDING_EXPANDING)
+            tab.setSizePolicy(_EXPANDING_EXPANDING)
             return True, ""
         except Exception as e:
             logger.error(
@@ -327,6 +349,37 @@ class ExperimentConfiguration(QWidget):
             )
             return False, f"{e}"
 
+    def _extract_task(self, index: int) -> Task:
+        """
+        Reads a single step back from the form of its tab.
+
+        Args:
+            index: The index of the step (and of its tab).
+        """
+        original_step = self.experiment.steps[index]
+        step_widget = self.tabWidget.widget(index)
+        if not step_widget.populated:
+            # The tab was never shown, so its step cannot have been edited
+            return original_step
+
+        parameters: Dict[str, Any] = {}
+        updated_delay = 0.0
+        for parameter_name, widget in step_widget.rows:
+            # Prevent adding delay directly to the parameters dictionary, bad things will happen : )
+            if parameter_name == DELAY_KEYWORD:
+                updated_delay = UIComponentFactory.extract_value(widget)
+            else:
+                parameters[parameter_name] = UIComponentFactory.extract_value(widget)
+
+        # The form widgets only produce values of the right types, so the Task is built
+        # without running pydantic validation again
+        return Task.model_construct(
+            task=original_step.task,
+            description=original_step.description,
+            delay=updated_delay,
+            parameters=parameters,
+        )
+
     def getUserData(self) -> Experiment:
         if not self.experiment:
             QMessageBox.warning(self, "Error", "No valid configuration loaded.")
@@ -335,52 +388,15 @@ class ExperimentConfiguration(QWidget):
         # Extract the name from the configuration to use in the new experiment model
         experiment_name = self.experiment.name
 
-        # Initialize an empty list to collect Task models
-        tasks: List[Task] = []
-        for index in range(self.tabWidget.count()):
-            if index >= len(self.experiment.steps):
-                continue
-
-            step_widget = self.tabWidget.widget(index)
-            form_widget = step_widget.findChild(QScrollArea).widget()
-            form_layout = form_widget.layout()
-
-            original_step = self.experiment.steps[index]
-            parameters: Dict[str, Any] = {}
-            updated_delay = 0.0
-            for i in range(form_layout.rowCount()):
-                widget_item = form_layout.itemAt(i, QFormLayout.ItemRole.FieldRole)
-                if widget_item is not None:
-                    widget = widget_item.widget()
-                    parameter_name = widget.property("parameter_name")
-                    if parameter_name:
-                        # Prevent adding delay directly to the parameters dictionary, bad things will happen : )
-                        if parameter_name == DELAY_KEYWORD:
-                            updated_delay = UIComponentFactory.extract_value(widget)
-                            continue
-                        else:
-                            parameters[parameter_name] = (
-                                UIComponentFactory.extract_value(widget)
-                            )
-
-            # Create a Task instance directly using the collected parameters.
-            task = Task(
-                task=original_step.task,
-                description=original_step.description,
-                delay=updated_delay,
-                parameters=parameters,
-            )
-            tasks.append(task)
+        # Collect the Task models, tabs beyond the loaded steps are skipped
+        tasks: List[Task] = [
+            self._extract_task(index)
+            for index in range(min(self.tabWidget.count(), len(self.experiment.steps)))
+        ]
 
-        # Create the Experiment instance with the collected tasks.
-        try:
-            experiment = Experiment(name=experiment_name, steps=tasks)
-        except ValidationError as e:
-            # Handle validation errors for the experiment.
-            QMessageBox.critical(self, "Validation Error", str(e))
-            logger.error(f"Error: {e}")
-            logger.error(f"{traceback.format_exc()}")
-        return experiment
+        # Create the Experiment instance with the collected tasks, validation is left to
+        # saveConfiguration where the result leaves the application
+        return Experiment.model_construct(name=experiment_name, steps=tasks)
 
     def getConfiguration(self) -> Experiment:
         """
@@ -392,21 +408,27 @@ class ExperimentConfiguration(QWidget):
         Raises:
             ValueError: If validation of the user-modified configuration fails.
         """
-        # Extract the user-modified configuration from the UI elements
-        updated_experiment = self.getUserData()
-        return updated_experiment
-
-    def get_function(self, task: Task) -> object | None:
+        # Extract the user-modified configuration from the UI elements, unless nothing
+        # was edited since it was last extracted
+        if self._userDataDirty or self._userExperiment is None:
+            self._userExperiment = self.getUserData()
+            self._userDataDirty = not self._userExperiment
+        return self._userExperiment
+
+    def get_function(self, task: Task) -> Callable:
         """
         Retrieves the function associated with a specific task name.
 
-        Looks up the function from the provided dictionary or returns None if not found.
+        Looks up the function through the validator's task function table.
 
         Args:
             task: The name of the task.
 
         Returns:
-            The function associated with the task or None if not found.
+            The function associated with the task.
+
+        Raises:
+            ValueError: If no function is associated with the task.
         """
         return self.validator.get_function_to_validate(task)
 
@@ -414,18 +436,11 @@ class ExperimentConfiguration(QWidget):
         if not data:
             return "No experiment configuration loaded."
 
-        experiment_name = data.name
-        steps = data.steps
-
-        summary_lines = [f"Experiment: {experiment_name}\n\nSteps Summary:"]
-
-        for i, step in enumerate(steps, 1):
-            task_name = step.task
-            description = step.description
-            summary_lines.append(
-                f"  Step {i}: {task_name} - {description if description else 'no description given'}"
-            )
-
+        summary_lines = [f"Experiment: {data.name}\n\nSteps Summary:"]
+        summary_lines.extend(
+            f"  Step {i}: {step.task} - {step.description or 'no description given'}"
+            for i, step in enumerate(data.steps, 1)
+        )
         return "\n".join(summary_lines)
 
     def saveConfiguration(self, config_path: str) -> bool:
@@ -445,8 +460,15 @@ class ExperimentConfiguration(QWidget):
 
         config = self.getConfiguration()
         try:
+            # Validated once here, before the file is opened for writing
+            config = Experiment.model_validate(config.model_dump())
             with open(config_path, "w") as file:
-                yaml.dump(config, file, sort_keys=False)
+                yaml.dump(
+                    {EXPERIMENT_KEYWORD: config.model_dump()},
+                    file,
+                    Dumper=SafeDumper,
+                    sort_keys=False,
+                )
             QMessageBox.information(
                 self, "Success", "Configuration saved successfully."
             )
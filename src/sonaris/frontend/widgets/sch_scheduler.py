@@ -1,4 +1,4 @@
-import json
+import os
 from typing import Callable
 
 from PyQt6 import QtCore
@@ -34,6 +34,8 @@ class SchedulerWidget(QWidget):
         )
         self.timekeeper.set_callback(self.popup_callback)
         self.root_callback = root_callback
+        # (mtime, size) of the archive the finished jobs table was last filled from
+        self._archiveStamp = None
         self.initUI()
 
     def initUI(self):
@@ -118,36 +120,40 @@ class SchedulerWidget(QWidget):
         mainLayout.addWidget(splitter)
 
     def update_jobs_table(self):
-        self.jobsTable.setRowCount(0)
         jobs = self.timekeeper.get_jobs()
-        for job_id, job_info in jobs.items():
-            row_position = self.jobsTable.rowCount()
-            self.jobsTable.insertRow(row_position)
-
-            # Create QTableWidgetItem for each entry and set it to non-editable
-            job_id_item = QTableWidgetItem(job_id)
-            job_id_item.setFlags(
-                job_id_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
-            )
-            self.jobsTable.setItem(row_position, 0, job_id_item)
-
-            task_name_item = QTableWidgetItem(job_info["task"])
-            task_name_item.setFlags(
-                task_name_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
-            )
-            self.jobsTable.setItem(row_position, 1, task_name_item)
-
-            schedule_time_item = QTableWidgetItem(job_info["schedule_time"])
-            schedule_time_item.setFlags(
-                schedule_time_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
-            )
-            self.jobsTable.setItem(row_position, 2, schedule_time_item)
-
-            parameters_item = QTableWidgetItem(str(job_info["kwargs"]))
-            parameters_item.setFlags(
-                parameters_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
-            )
-            self.jobsTable.setItem(row_position, 3, parameters_item)
+        # Fill all rows with updates and signals off, so the view repaints once
+        self.jobsTable.setUpdatesEnabled(False)
+        self.jobsTable.blockSignals(True)
+        try:
+            self.jobsTable.setRowCount(len(jobs))
+            for row_position, (job_id, job_info) in enumerate(jobs.items()):
+                # Create QTableWidgetItem for each entry and set it to non-editable
+                job_id_item = QTableWidgetItem(job_id)
+                job_id_item.setFlags(
+                    job_id_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
+                )
+                self.jobsTable.setItem(row_position, 0, job_id_item)
+
+                task_name_item = QTableWidgetItem(job_info["task"])
+                task_name_item.setFlags(
+                    task_name_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
+                )
+                self.jobsTable.setItem(row_position, 1, task_name_item)
+
+                schedule_time_item = QTableWidgetItem(job_info["schedule_time"])
+                schedule_time_item.setFlags(
+                    schedule_time_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
+                )
+                self.jobsTable.setItem(row_position, 2, schedule_time_item)
+
+                parameters_item = QTableWidgetItem(str(job_info["kwargs"]))
+                parameters_item.setFlags(
+                    parameters_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
+                )
+                self.jobsTable.setItem(row_position, 3, parameters_item)
+        finally:
+            self.jobsTable.blockSignals(False)
+            self.jobsTable.setUpdatesEnabled(True)
 
     def remove_selected_job(self):
         selected_items = self.jobsTable.selectedItems()
@@ -163,30 +169,47 @@ class SchedulerWidget(QWidget):
             logger.info("No job selected")
 
     def update_finished_jobs_list(self):
-        self.finishedJobsTable.setRowCount(0)  # Clear the existing rows in the table
-        finished_jobs = logutils.load_json_with_backup(self.timekeeper.archive)
-
-        for job_id, job_info in finished_jobs.items():
-            row_position = self.finishedJobsTable.rowCount()
-            self.finishedJobsTable.insertRow(row_position)
+        # Scheduling a job also lands here, the archive only has to be parsed again
+        # once a job finished or it was cleared
+        try:
+            stat = os.stat(self.timekeeper.archive)
+            archiveStamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            archiveStamp = None
+        if archiveStamp is not None and archiveStamp == self._archiveStamp:
+            return
+        self._archiveStamp = archiveStamp
 
-            result_item = QTableWidgetItem(
-                "OK" if job_info.get("result", False) else "ERR"
-            )
-            task_item = QTableWidgetItem(job_info.get("task", ""))
-            job_id_item = QTableWidgetItem(job_id)
+        finished_jobs = logutils.load_json_with_backup(self.timekeeper.archive)
+        # Fill all rows with updates and signals off, so the view repaints once
+        self.finishedJobsTable.setUpdatesEnabled(False)
+        self.finishedJobsTable.blockSignals(True)
+        try:
+            # Replaces the existing rows in the table
+            self.finishedJobsTable.setRowCount(len(finished_jobs))
+            for row_position, (job_id, job_info) in enumerate(finished_jobs.items()):
+                result_item = QTableWidgetItem(
+                    "OK" if job_info.get("result", False) else "ERR"
+                )
+                task_item = QTableWidgetItem(job_info.get("task", ""))
+                job_id_item = QTableWidgetItem(job_id)
 
-            result_item.setFlags(
-                result_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
-            )
-            task_item.setFlags(task_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable)
-            job_id_item.setFlags(
-                job_id_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
-            )
+                result_item.setFlags(
+                    result_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
+                )
+                task_item.setFlags(
+                    task_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
+                )
+                job_id_item.setFlags(
+                    job_id_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
+                )
 
-            self.finishedJobsTable.setItem(row_position, 0, result_item)
-            self.finishedJobsTable.setItem(row_position, 1, task_item)
-            self.finishedJobsTable.setItem(row_position, 2, job_id_item)
+                self.finishedJobsTable.setItem(row_position, 0, result_item)
+                self.finishedJobsTable.setItem(row_position, 1, task_item)
+                self.finishedJobsTable.setItem(row_position, 2, job_id_item)
+        finally:
+            self.finishedJobsTable.blockSignals(False)
+            self.finishedJobsTable.setUpdatesEnabled(True)
 
     def clear_finished_jobs(self):
         # Confirmation message box
@@ -229,8 +252,7 @@ class SchedulerWidget(QWidget):
         if job_id_item:
             job_id = job_id_item.text()
             try:
-                with self.timekeeper.archive.open("r") as file:
-                    finished_jobs = json.load(file)
+                finished_jobs = logutils.read_json(self.timekeeper.archive)
                 job_details = finished_jobs.get(job_id, {})
                 if job_details:
                     dialog = TaskDetailsDialog(job_details, self)
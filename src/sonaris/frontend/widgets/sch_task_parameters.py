@@ -20,8 +20,12 @@ class TaskParameterConfiguration(QWidget):
             where each task is represented by a function defining its parameters.
         task_enum (Optional[Any]): An optional enumeration to categorize tasks. The exact type
             is not specified, allowing for flexibility in task categorization.
+        task_index (Dict[Tuple[str, str], Callable]): The task functions keyed by
+            (device, task name), so a selection resolves with a single lookup.
         widget_cache (Dict[Tuple[str, str], QWidget]): A cache to store generated UI components
             for quick retrieval, avoiding redundant UI construction.
+        field_cache (Dict[Tuple[str, str], List[Tuple[str, QWidget]]]): The (parameter name,
+            input widget) pairs of each cached page, read back by getUserData.
         stacked_widget (QStackedWidget): A widget that can stack multiple child widgets, showing one at a time.
         main_layout (QVBoxLayout): The main layout for arranging child widgets vertically.
     """
@@ -37,8 +41,15 @@ class TaskParameterConfiguration(QWidget):
         self.input_callback = input_callback
         self.updated_config: dict = None
         self.task_dictionary: Dict[str, Dict[str, Callable]] = task_dictionary
+        self.task_index: Dict[Tuple[str, str], Callable] = {
+            (device, task_name): task_func
+            for device, tasks in task_dictionary.items()
+            for task_name, task_func in tasks.items()
+        }
         self.task_enum: Optional[Any] = task_enum
         self.widget_cache: Dict[Tuple[str, str], QWidget] = {}
+        self.field_cache: Dict[Tuple[str, str], List[Tuple[str, QWidget]]] = {}
+        self.current_fields: List[Tuple[str, QWidget]] = []
         self.initUI()
 
     def initUI(self):
@@ -56,17 +67,18 @@ class TaskParameterConfiguration(QWidget):
             task_name (str): The name of the task for which the UI should be updated.
         """
         cache_key: Tuple[str, str] = (device, task_name)
-        if cache_key not in self.widget_cache:
-            task_func: Optional[Callable] = self.task_dictionary.get(device, {}).get(
-                task_name
-            )
+        container_widget: Optional[QWidget] = self.widget_cache.get(cache_key)
+        if container_widget is None:
+            # Pages are only built the first time their task is selected
+            task_func: Optional[Callable] = self.task_index.get(cache_key)
             spec: List[QWidget] = self._infer_ui_spec_from_function(task_func)
-            container_widget: QWidget = self.generateUI(spec)
+            container_widget = self.generateUI(spec)
             self.widget_cache[cache_key] = container_widget
+            self.field_cache[cache_key] = [(item[0], item[1]) for item in spec]
             self.stacked_widget.addWidget(container_widget)
 
-        index: int = self.stacked_widget.indexOf(self.widget_cache[cache_key])
-        self.stacked_widget.setCurrentIndex(index)
+        self.current_fields = self.field_cache[cache_key]
+        self.stacked_widget.setCurrentWidget(container_widget)
 
     def _infer_ui_spec_from_function(self, task_function: Callable) -> List[QWidget]:
         """
@@ -141,15 +153,10 @@ class TaskParameterConfiguration(QWidget):
         Returns:
             Dict[str, Any]: A dictionary containing the collected input data.
         """
-        self.updated_config: Dict[str, Any] = {}
-        current_widget = self.stacked_widget.currentWidget()
-        if current_widget:
-            for widget in current_widget.findChildren(QWidget):
-                parameter_name = widget.property("parameter_name")
-                if parameter_name:
-                    self.updated_config[parameter_name] = (
-                        UIComponentFactory.extract_value(widget)
-                    )
+        self.updated_config: Dict[str, Any] = {
+            parameter_name: UIComponentFactory.extract_value(widget)
+            for parameter_name, widget in self.current_fields
+        }
 
     def getConfiguration(self) -> Dict[str, Any]:
         """
@@ -5,8 +5,8 @@ import yaml
 from PyQt6 import QtCore
 from PyQt6.QtWidgets import (
     QComboBox,
+    QDateTimeEdit,
     QDialog,
-    QDoubleSpinBox,
     QGridLayout,
     QGroupBox,
     QHBoxLayout,
@@ -14,8 +14,7 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QSizePolicy,
     QSpinBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTextEdit,
     QVBoxLayout,
     QWidget,
@@ -24,23 +23,55 @@ from PyQt6.QtWidgets import (
 from sonaris.defaults import DELAY_KEYWORD, TASKS_MISSING, TIMESTAMP_KEYWORD
 from sonaris.frontend.widgets.sch_task_parameters import TaskParameterConfiguration
 from sonaris.scheduler.timekeeper import Timekeeper
-from sonaris.tasks.model import Experiment, Task
 from sonaris.tasks.task_validator import Validator
 from sonaris.tasks.tasks import TaskName, get_tasks
 from sonaris.utils.log import get_logger
+from sonaris.utils.yaml_format import SafeDumper, format_mapping
 
 logger = get_logger()
 
 
 class TaskConfigPopup(QDialog):
+    # Shared by every popup instance; the task dictionaries are read-only
+    task_dict = get_tasks(flatten=False)
+    _deviceNames = list(task_dict)
+    # Kept on the class so the signal handlers do not look up the module global.
+    Dumper = SafeDumper
+    # Built once rather than per yaml.dump call in the preview fallback
+    _DUMP_KW = {"Dumper": Dumper, "sort_keys": False, "default_flow_style": False}
+    YAML_DEBOUNCE_MS = 50
+    # (label, field, row, column, minimum, maximum) of the delay inputs
+    _DELAY_FIELDS = (
+        ("Days", "days", 0, 0, 0, 9999),
+        ("Hours", "hours", 0, 1, 0, 23),
+        ("Minutes", "minutes", 1, 1, 0, 59),
+        ("Seconds", "seconds", 2, 1, 0, 59),
+        ("Milliseconds", "milliseconds", 3, 1, 0, 999),
+    )
 
     def __init__(self, timekeeper: Timekeeper, callback: Callable):
         super().__init__()
         self.resize(864, 400)
-        self.task_dict = get_tasks(flatten=False)
         self.task_enum = TaskName
         self.timekeeper = timekeeper
         self.callback = callback
+        # Refreshed on task / time mode changes instead of on every YAML refresh
+        self._cachedTaskEnumName: str | None = None
+        self._isTimestamp = False
+        # Parameter values only change through the parameter widgets, so time input
+        # changes reuse the last fetched configuration
+        self._paramsCache: dict = {}
+        self._paramsYamlLines: list | None = None
+        self._paramsDirty = True
+        # What the preview currently shows, to skip refreshes that change nothing
+        self._lastDelaySeconds: float | None = None
+        self._lastTaskEnumName: str | None = None
+        # Coalesces bursts of input signals (e.g. holding a spin box arrow) into one
+        # YAML refresh once the input settles
+        self._yamlTimer = QtCore.QTimer(self)
+        self._yamlTimer.setSingleShot(True)
+        self._yamlTimer.setInterval(self.YAML_DEBOUNCE_MS)
+        self._yamlTimer.timeout.connect(self._doUpdateYamlDisplay)
 
         self.initUI()
         self.connectSignals()
@@ -66,7 +97,7 @@ class TaskConfigPopup(QDialog):
         configurationLayout.addWidget(QLabel("Select Task:"))
         configurationLayout.addWidget(self.taskSelect)
 
-        self.deviceSelect.addItems(self.task_dict.keys())
+        self.deviceSelect.addItems(self._deviceNames)
         self.gridLayout.addWidget(configurationGroup, 0, 0, 1, 2)
 
     def setupTimeConfigurationGroup(self):
@@ -84,7 +115,7 @@ class TaskConfigPopup(QDialog):
             task_dictionary=self.task_dict,
             parent=self,
             task_enum=self.task_enum,
-            input_callback=self.updateYamlDisplay,
+            input_callback=self._onParameterChanged,
         )
         parameterConfigGroup = QGroupBox("Parameter Configuration")
         parameterConfigLayout = QVBoxLayout(parameterConfigGroup)
@@ -112,63 +143,114 @@ class TaskConfigPopup(QDialog):
     def connectSignals(self):
         self.deviceSelect.currentIndexChanged.connect(self.updateTaskList)
         self.taskSelect.currentIndexChanged.connect(self.updateUI)
-        self.timeConfigComboBox.currentIndexChanged.connect(self.updateYamlDisplay)
+        self.timeConfigComboBox.currentIndexChanged.connect(self._onTimeConfigChanged)
+
+    def _onParameterChanged(self):
+        self._paramsDirty = True
+        self.updateYamlDisplay()
 
     def updateYamlDisplay(self):
+        """Schedules a refresh of the YAML display, coalescing repeated requests."""
+        self._yamlTimer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Refreshes skipped while hidden are caught up here
+        self.updateYamlDisplay()
+
+    def _doUpdateYamlDisplay(self):
         # This method updates the YAML display based on current configurations
-        parameters = self.parameterConfig.getConfiguration()
+        if not self.yamlDisplayWidget.isVisible():
+            return
         now = datetime.now()
 
-        if (
-            self.timeConfigComboBox.currentText() == "TIMESTAMP"
-        ):  # Assuming TIMESTAMP_KEYWORD is "TIMESTAMP"
-            schedule_time = self.getDateTimeFromInputs()
-            # Calculate the delay as the difference between the schedule time and now
-            delay = (schedule_time - now).total_seconds()
-        else:
-            # Directly use the delay from the inputs if "delay" is selected
-            delay = (self.getDateTimeFromInputs() - now).total_seconds()
+        # The same timestamp is used for the schedule time and the delay, so in
+        # delay mode the displayed delay is exactly the entered one
+        delay = (self.getDateTimeFromInputs(now) - now).total_seconds()
 
         # Ensure delay is always positive before displaying
-        delay = max(0, delay)  # Reset to 0 if negative
-
-        # Use the Task and Experiment models to create the configuration
-        task_name = Validator.get_task_enum_name(
-            self.taskSelect.currentText(),
-            self.task_enum,  # Assuming you have task_enum available
-        )
+        delay = max(0.0, delay)  # Reset to 0 if negative
 
-        task = Task(
-            task=task_name,
-            delay=delay,
-            description=f"{self.taskSelect.currentText()} at time {delay}s",
-            parameters=parameters,
+        # e.g. switching the time mode back and forth without editing either input
+        if (
+            not self._paramsDirty
+            and delay == self._lastDelaySeconds
+            and self._cachedTaskEnumName == self._lastTaskEnumName
+        ):
+            return
+
+        if self._paramsDirty:
+            self._paramsCache = self.parameterConfig.getConfiguration()
+            # Formatted once per parameter change, time changes only re-emit the header
+            self._paramsYamlLines = format_mapping(
+                {"parameters": self._paramsCache}, indent="  "
+            )
+            self._paramsDirty = False
+        parameters = self._paramsCache
+
+        yamlStr = self._emitConfigYaml(
+            self._cachedTaskEnumName,
+            delay,
+            f"{self.taskSelect.currentText()} at time {delay}s",
+            parameters,
+            self._paramsYamlLines,
         )
+        self.yamlDisplayWidget.setPlainText(yamlStr)
+        self._lastDelaySeconds = delay
+        self._lastTaskEnumName = self._cachedTaskEnumName
+
+    @classmethod
+    def _emitConfigYaml(
+        cls,
+        task_name: str,
+        delay: float,
+        description: str,
+        parameters: dict,
+        parameter_lines: list | None = None,
+    ) -> str:
+        """
+        Emits the YAML of a single-step experiment for the preview.
+
+        The schema is fixed (name / steps / task, description, delay, parameters), so the
+        step is formatted directly; the output is the same as yaml.dump on the equivalent
+        Experiment model. Values outside the fast path fall back to yaml.dump.
+        parameter_lines are the already formatted lines of the parameters entry.
+        """
+        header = {"task": task_name, "description": description, "delay": delay}
+        lines = format_mapping(header, indent="  ")
+        if parameter_lines is None:
+            parameter_lines = format_mapping({"parameters": parameters}, indent="  ")
+        if lines is None or parameter_lines is None:
+            return yaml.dump(
+                {"name": "unnamed", "steps": [header | {"parameters": parameters}]},
+                **cls._DUMP_KW,
+            )
+        lines[0] = "- " + lines[0][2:]
+        lines.extend(parameter_lines)
+        return "name: unnamed\nsteps:\n" + "\n".join(lines) + "\n"
 
-        # Wrap the task in an Experiment model
-        experiment = Experiment(name="unnamed", steps=[task])
-
-        # Convert the Experiment model instance to YAML string for display
-        yamlStr = yaml.dump(
-            experiment.dict(), sort_keys=False, default_flow_style=False
-        )
-        self.yamlDisplayWidget.setText(yamlStr)
+    def _onTimeConfigChanged(self):
+        self.updateTimeConfigurationVisibility(self.timeConfigComboBox.currentText())
+        self.updateYamlDisplay()
 
     def updateTimeConfigurationVisibility(self, selection):
         isTimestamp = selection == TIMESTAMP_KEYWORD
+        self._isTimestamp = isTimestamp
         self.timestampWidget.setVisible(isTimestamp)
         self.delayWidget.setVisible(not isTimestamp)
 
     def updateTaskList(self):
         selected_device = self.deviceSelect.currentText()
         tasks = self.task_dict.get(selected_device, {}).keys()
-        self.taskSelect.clear()
-        if tasks:
-            self.taskSelect.addItems(tasks)
-            self.taskSelect.setCurrentIndex(0)
-        else:
-            self.taskSelect.addItem(TASKS_MISSING)
-            self.taskSelect.setCurrentIndex(0)
+        # Repopulating would emit currentIndexChanged (and so updateUI) several times
+        with QtCore.QSignalBlocker(self.taskSelect):
+            self.taskSelect.clear()
+            if tasks:
+                self.taskSelect.addItems(tasks)
+                self.taskSelect.setCurrentIndex(0)
+            else:
+                self.taskSelect.addItem(TASKS_MISSING)
+                self.taskSelect.setCurrentIndex(0)
         self.updateUI()
 
     def updateUI(self):
@@ -176,8 +258,11 @@ class TaskConfigPopup(QDialog):
         selected_task = self.taskSelect.currentText()
         # Check if the selected task is valid before updating UI
         if selected_task and selected_task != "No tasks available":
+            self._cachedTaskEnumName = Validator.get_task_enum_name(
+                selected_task, self.task_enum
+            )
             self.parameterConfig.updateUI(selected_device, selected_task)
-            self.updateYamlDisplay()
+            self._onParameterChanged()
 
         else:
             pass
@@ -199,68 +284,24 @@ class TaskConfigPopup(QDialog):
 
         self.updateTimeConfigurationVisibility(self.timeConfigComboBox.currentText())
 
-        # Connect the combobox signal
-        self.timeConfigComboBox.currentIndexChanged.connect(
-            lambda: self.updateTimeConfigurationVisibility(
-                self.timeConfigComboBox.currentText()
-            )
-        )
-
-    def createDateTimeInputs(self, default_value):
+    def createDateTimeInputs(self, default_value: datetime):
         gridLayout = QGridLayout()
-        self.timestampInputs = {}
-
-        # Define the fields, limits, and their positions in the grid
-        fields = [
-            ("Year", "year", 0, 0, 1900, 2100),
-            ("Month", "month", 1, 0, 1, 12),
-            ("Day", "day", 2, 0, 1, 31),
-            ("Hour", "hour", 0, 1, 0, 23),
-            ("Minute", "minute", 1, 1, 0, 59),
-            ("Second", "second", 2, 1, 0, 59),
-            # Assuming milliseconds need to be input as a float
-            ("Millisecond", "millisecond", 3, 1, 0, 999),
-        ]
-
-        for label_text, field, row, col, min_val, max_val in fields:
-            label = QLabel(f"{label_text}:")
-            if field == "millisecond":
-                inputWidget = QDoubleSpinBox(self)
-                inputWidget.setDecimals(0)  # Adjust as needed for precision
-            else:
-                inputWidget = QSpinBox(self)
-
-            inputWidget.setRange(min_val, max_val)
-            inputWidget.setValue(getattr(default_value, field, min_val))
-            inputWidget.valueChanged.connect(self.updateYamlDisplay)
-
-            gridLayout.addWidget(label, row, col * 2)
-            gridLayout.addWidget(inputWidget, row, col * 2 + 1)
-            self.timestampInputs[field] = inputWidget
+        self.timestampEdit = QDateTimeEdit(default_value, self)
+        self.timestampEdit.setDisplayFormat("yyyy-MM-dd HH:mm:ss.zzz")
+        self.timestampEdit.setCalendarPopup(True)
+        self.timestampEdit.dateTimeChanged.connect(self.updateYamlDisplay)
 
+        gridLayout.addWidget(QLabel("Date and time:"), 0, 0)
+        gridLayout.addWidget(self.timestampEdit, 0, 1)
         return gridLayout
 
     def createwaitInputs(self):
         gridLayout = QGridLayout()
         self.waitInputs = {}
 
-        # Define the fields and their positions in the grid
-        fields = [
-            ("Days", "days", 0, 0, 0, 9999),
-            ("Hours", "hours", 0, 1, 0, 23),
-            ("Minutes", "minutes", 1, 1, 0, 59),
-            ("Seconds", "seconds", 2, 1, 0, 59),
-            ("Milliseconds", "milliseconds", 3, 1, 0, 999),
-        ]
-
-        for label_text, field, row, col, min_val, max_val in fields:
+        for label_text, field, row, col, min_val, max_val in self._DELAY_FIELDS:
             label = QLabel(f"{label_text}:")
-            if field == "millisecond":
-                inputWidget = QDoubleSpinBox(self)
-                inputWidget.setDecimals(0)  # Adjust as needed for precision
-            else:
-                inputWidget = QSpinBox(self)
-
+            inputWidget = QSpinBox(self)
             inputWidget.setRange(min_val, max_val)
             inputWidget.setValue(min_val)
             inputWidget.valueChanged.connect(self.updateYamlDisplay)
@@ -271,14 +312,6 @@ class TaskConfigPopup(QDialog):
 
         return gridLayout
 
-    def toggleTimeInputs(self):
-        # Toggle visibility of time input fields based on selected option
-        isTimestamp = bool(self.timeConfigComboBox.currentText() == TIMESTAMP_KEYWORD)
-        for input in self.timestampInputs:
-            input.setVisible(isTimestamp)
-        for input in self.waitInputs:
-            input.setVisible(not isTimestamp)
-
     def accept(self):
         # Schedule the task with either timestamp or delay
         selected_task = self.taskSelect.currentText()
@@ -296,31 +329,51 @@ class TaskConfigPopup(QDialog):
         except Exception as e:
             logger.info({f"Error during commissioning task on : {e}"})
 
-    def getDateTimeFromInputs(self):
-        if self.timeConfigComboBox.currentText() == TIMESTAMP_KEYWORD:
-            # Convert microsecond value to an integer
-            microsecond = int(self.timestampInputs["millisecond"].value() * 1000)
-
-            return datetime(
-                year=self.timestampInputs["year"].value(),
-                month=self.timestampInputs["month"].value(),
-                day=self.timestampInputs["day"].value(),
-                hour=self.timestampInputs["hour"].value(),
-                minute=self.timestampInputs["minute"].value(),
-                second=self.timestampInputs["second"].value(),
-                microsecond=microsecond,
-            )
+    def getDateTimeFromInputs(self, now: datetime | None = None):
+        if self._isTimestamp:
+            return self.timestampEdit.dateTime().toPyDateTime()
         else:
             delay = timedelta(
                 days=self.waitInputs["days"].value(),
                 hours=self.waitInputs["hours"].value(),
                 minutes=self.waitInputs["minutes"].value(),
                 seconds=self.waitInputs["seconds"].value(),
-                milliseconds=int(
-                    self.waitInputs["milliseconds"].value()
-                ),  # Ensure integer for milliseconds
+                milliseconds=self.waitInputs["milliseconds"].value(),
             )
-            return datetime.now() + delay
+            return (now or datetime.now()) + delay
+
+
+class TaskDetailsModel(QtCore.QAbstractTableModel):
+    """Read-only two column (field, value) view over a task details dictionary."""
+
+    HEADERS = ("Field", "Value")
+
+    def __init__(self, task_details: dict, parent=None):
+        super().__init__(parent)
+        self._rows = [(str(key), str(value)) for key, value in task_details.items()]
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if role == QtCore.Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if (
+            role == QtCore.Qt.ItemDataRole.DisplayRole
+            and orientation == QtCore.Qt.Orientation.Horizontal
+        ):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        # Not editable
+        return QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable
 
 
 class TaskDetailsDialog(QDialog):
@@ -333,36 +386,25 @@ class TaskDetailsDialog(QDialog):
 
         layout = QVBoxLayout(self)
 
-        self.tableWidget = QTableWidget(self)
-        self.tableWidget.setColumnCount(2)
-        self.tableWidget.setHorizontalHeaderLabels(["Field", "Value"])
+        self.tableView = QTableView(self)
         self.populate_table(task_details)
 
         # Set the table to expand to fill the dialog
-        self.tableWidget.setSizePolicy(
+        self.tableView.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
         )
 
-        layout.addWidget(self.tableWidget)
+        layout.addWidget(self.tableView)
 
         closeButton = QPushButton("Close")
         closeButton.clicked.connect(self.accept)
         layout.addWidget(closeButton)
 
     def populate_table(self, task_details):
-        self.tableWidget.setRowCount(len(task_details))
-        for row, (key, value) in enumerate(task_details.items()):
-            key_item = QTableWidgetItem(str(key))
-            value_item = QTableWidgetItem(str(value))
-
-            # Set the items to be non-editable
-            key_item.setFlags(key_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable)
-            value_item.setFlags(value_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable)
-
-            self.tableWidget.setItem(row, 0, key_item)
-            self.tableWidget.setItem(row, 1, value_item)
+        # The model serves the cells straight from the dictionary, no per-cell items
+        self.tableView.setModel(TaskDetailsModel(task_details, self.tableView))
 
         # Resize columns to fit the content after populating the table
-        self.tableWidget.resizeColumnsToContents()
+        self.tableView.resizeColumnsToContents()
         # Optionally, you can stretch the last section to fill the remaining space
-        self.tableWidget.horizontalHeader().setStretchLastSection(True)
+        self.tableView.horizontalHeader().setStretchLastSection(True)
@@ -1,4 +1,5 @@
-from typing import Any, Callable, Tuple, Type
+import functools
+from typing import Any, Callable, Hashable, Tuple, Type
 
 from PyQt6.QtCore import pyqtBoundSignal
 from PyQt6.QtWidgets import (
@@ -12,27 +13,98 @@ from PyQt6.QtWidgets import (
 
 from sonaris.defaults import DECIMAL_POINTS
 
+_INT_RANGE = (-2147483648, 2147483647)  # Default 32-bit integer range
+_FLOAT_RANGE = (-1.0e100, 1.0e100)
+
+
+def _mk_combo(items: Tuple[Tuple[str, Any], ...], default: Any) -> Tuple[QWidget, Any]:
+    widget = QComboBox()
+    for text, value in items:
+        widget.addItem(text, value)
+    return widget, default
+
+
+def _mk_spin(value_range: Tuple[int, int]) -> Tuple[QWidget, Any]:
+    widget = QSpinBox()
+    widget.setRange(*value_range)
+    return widget, 0
+
+
+def _mk_double_spin(value_range: Tuple[float, float]) -> Tuple[QWidget, Any]:
+    widget = QDoubleSpinBox()
+    widget.setDecimals(DECIMAL_POINTS)
+    widget.setRange(*value_range)
+    return widget, 0.0
+
+
+def _mk_check() -> Tuple[QWidget, Any]:
+    return QCheckBox(), False
+
+
+def _mk_line_edit() -> Tuple[QWidget, Any]:
+    # Optionally set a placeholder text here to guide the user
+    return QLineEdit(), ""
+
+
+def _combo_builder(values: tuple) -> Callable[[], Tuple[QWidget, Any]]:
+    return functools.partial(
+        _mk_combo, tuple((str(value), value) for value in values), values[0]
+    )
+
+
+def _line_edit_builder(values: Any) -> Callable[[], Tuple[QWidget, Any]]:
+    # str and any other type without specific constraints
+    return _mk_line_edit
+
+
+# (constraint kind, parameter type) -> factory turning the constraint values into a
+# widget builder. Kinds without an entry fall back to the (None, type) entry.
+_BUILDERS = {
+    **{("list", param_type): _combo_builder for param_type in (int, float, str, bool)},
+    ("tuple", int): lambda values: functools.partial(
+        _mk_spin, (values[0], values[1]) if values else _INT_RANGE
+    ),
+    (None, int): lambda values: functools.partial(_mk_spin, _INT_RANGE),
+    ("tuple", float): lambda values: functools.partial(
+        _mk_double_spin, (values[0], values[1]) if values else _FLOAT_RANGE
+    ),
+    (None, float): lambda values: functools.partial(_mk_double_spin, _FLOAT_RANGE),
+    (None, bool): lambda values: _mk_check,
+}
+
 
 class UIComponentFactory:
 
-    TRUTH_VALUES = [
-        "true",
-        "1",
-        "on",
-        "ok",
-        "yes",
-        "resume",
-        "continue",
-    ]
-    FALSE_VALUES = [
-        "false",
-        "0",
-        "off",
-        "no",
-        "cancel",
-        "abort",
-        "deny",
-    ]
+    # Only used for membership tests
+    TRUTH_VALUES = frozenset(
+        {
+            "true",
+            "1",
+            "on",
+            "ok",
+            "yes",
+            "resume",
+            "continue",
+        }
+    )
+    FALSE_VALUES = frozenset(
+        {
+            "false",
+            "0",
+            "off",
+            "no",
+            "cancel",
+            "abort",
+            "deny",
+        }
+    )
+
+    _TYPE_MAP = {
+        "bool": bool,
+        "int": int,
+        "float": float,
+        "str": str,
+    }
 
     SIGNAL_MAP = {
         QLineEdit: "textChanged",
@@ -117,19 +189,12 @@ class UIComponentFactory:
                 return i
         return 0  # Default to the first index if no match found
 
-    @staticmethod
-    def map_type_name_to_type(type_name: str):
+    @classmethod
+    def map_type_name_to_type(cls, type_name: str):
         """
         Maps a type name (string) back to a type. This is needed for casting values fetched from UI components.
         """
-        return {
-            "bool": bool,
-            "int": int,
-            "float": float,
-            "str": str,
-        }.get(
-            type_name, None
-        )  # Default to str if not found
+        return cls._TYPE_MAP.get(type_name, None)
 
     @staticmethod
     def map_type_to_widget(
@@ -138,45 +203,50 @@ class UIComponentFactory:
         """
         Maps a parameter type to a PyQt widget, considering the constraints.
         """
-        if param_type in [int, float, str, bool] and isinstance(constraints, list):
-            widget = QComboBox()
-            for value in constraints:
-                widget.addItem(str(value), value)
-            default_value = constraints[0]
-        elif param_type == int:
-            widget = QSpinBox()
-            if constraints and isinstance(constraints, tuple):
-                widget.setMinimum(constraints[0])
-                widget.setMaximum(constraints[1])
-            else:
-                widget.setRange(-2147483648, 2147483647)  # Default 32-bit integer range
-            default_value = 0
-
-        elif param_type == float:
-            widget = QDoubleSpinBox()
-            widget.setDecimals(DECIMAL_POINTS)
-            if constraints and isinstance(constraints, tuple):
-                widget.setMinimum(constraints[0])
-                widget.setMaximum(constraints[1])
-            else:
-                widget.setRange(-1.0e100, 1.0e100)
-                # Default to 3 decimal places for broad applicability
-            default_value = 0.0
+        constraints_key = UIComponentFactory._constraints_key(constraints)
+        try:
+            hash(constraints_key)
+        except TypeError:
+            # Unhashable constraint values, resolve the builder without caching it
+            return UIComponentFactory._widget_builder.__wrapped__(
+                param_type, constraints_key
+            )()
+        return UIComponentFactory._widget_builder(param_type, constraints_key)()
 
-        elif param_type == str:
-            widget = QLineEdit()
-            # Optionally set a placeholder text here to guide the user
-            default_value = ""
+    @staticmethod
+    def _constraints_key(constraints: Any) -> Hashable:
+        """
+        Freezes constraints into a cache key. The container type and the type of every
+        value are kept so that e.g. [1, 0] and [True, False] do not share a builder.
+        """
+        if isinstance(constraints, (list, tuple)):
+            return type(constraints), tuple((type(v), v) for v in constraints)
+        return type(constraints), constraints
 
-        elif param_type == bool:
-            widget = QCheckBox()
-            default_value = False
-        else:  # Default case, especially for types like str without specific constraints
-            widget = QLineEdit()
-            default_value = ""
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _widget_builder(
+        param_type: type, constraints_key: Hashable
+    ) -> Callable[[], Tuple[QWidget, Any]]:
+        """
+        Parses the constraints for a (type, constraints) shape once and returns a builder
+        that constructs a fresh widget and its default value on every call.
+        """
+        kind, frozen = constraints_key
+        if issubclass(kind, (list, tuple)):
+            values = tuple(value for _, value in frozen)
+        else:
+            values = frozen
 
-        # Set property to identify the expected type easily
-        return widget, default_value
+        kind_name = (
+            "list"
+            if issubclass(kind, list)
+            else "tuple" if issubclass(kind, tuple) else None
+        )
+        factory = _BUILDERS.get((kind_name, param_type)) or _BUILDERS.get(
+            (None, param_type), _line_edit_builder
+        )
+        return factory(values)
 
     @staticmethod
     def connect_widget_signal(widget: QWidget, callback: Callable[[Any], None]) -> None:
@@ -224,6 +294,6 @@ class UIComponentFactory:
                 return bool(
                     value
                 )  # Directly cast to bool for non-string values depending of Pythonic truthiness
-        elif cast_type in [int, float, str]:
+        elif cast_type in (int, float, str):
             return cast_type(value) if cast_type else None
         return value if value else None
@@ -8,7 +8,7 @@ from typing import Any, Callable, Dict
 
 from sonaris.defaults import DEFAULT_DATADIR
 from sonaris.scheduler.worker import Worker
-from sonaris.utils.log import create_numbered_backup, get_logger
+from sonaris.utils.log import create_numbered_backup, get_logger, read_json
 
 
 class Timekeeper:
@@ -40,7 +40,7 @@ class Timekeeper:
         self.__reschedule_jobs__()
         self.user_callback = user_callback
     def get_archive(self) -> Dict[str, Any]:
-        return json.loads(self.archive.read_text())
+        return read_json(self.archive)
     def set_callback(self, user_callback: Callable) -> None:
         self.user_callback = user_callback
 
@@ -69,8 +69,7 @@ class Timekeeper:
             Dict[str, Any]: A dictionary of jobs indexed by their IDs.
         """
         try:
-            with open(self.persistence_file, "r") as file:
-                return json.load(file)
+            return read_json(self.persistence_file)
         except (FileNotFoundError, json.JSONDecodeError):
             return {}
 
@@ -197,10 +196,9 @@ class Timekeeper:
                 with open(self.archive, "w") as file:
                     json.dump({}, file)
 
+            archived_jobs = read_json(self.archive)
+            archived_jobs[job_id] = job_info
             with open(self.archive, "r+") as file:
-                archived_jobs = json.load(file)
-                archived_jobs[job_id] = job_info
-                file.seek(0)
                 json.dump(archived_jobs, file, indent=4)
 
             self.logger.info(f"Job {job_id} archived.")
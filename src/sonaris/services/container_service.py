@@ -34,25 +34,25 @@ class ContainerService(Service):
         if self._client is None:
             try:
                 self._client = DockerClient.from_env()
-                logger.info(f"Docker client obtained: {self._client}")
+                logger.info("Docker client obtained: %s", self._client)
                 self._client.ping()
             except Exception as e:
-                logger.error(f"Failed to obtain Docker client: {e}")
+                logger.error("Failed to obtain Docker client: %s", e)
                 self._client = None
 
     def ensure_docker_network(self):
         if self._network is None and self._client is not None:
             try:
                 self._network = self._client.networks.get(self._network_name)
-                logger.info(f"Found existing network: {self._network_name}")
+                logger.info("Found existing network: %s", self._network_name)
             except Exception as e:
                 try:
                     self._network = self._client.networks.create(
                         self._network_name, driver="bridge", check_duplicate=True
                     )
-                    logger.info(f"Created new network: {self._network_name}")
+                    logger.info("Created new network: %s", self._network_name)
                 except Exception as e:
-                    logger.error(f"Failed to create or retrieve network: {e}")
+                    logger.error("Failed to create or retrieve network: %s", e)
                     self._network = None
 
     def _generate_hash_(self) -> str:
@@ -96,25 +96,28 @@ class ContainerService(Service):
         """
         if self.client is None:
             logger.error(
-                f"Docker client is unavailable. Cannot start {self.service_name} service."
+                "Docker client is unavailable. Cannot start %s service.",
+                self.service_name,
             )
             return
 
         container = self.find_container()
         if container is None:
             logger.info(
-                f"{self.service_name} container not found, creating a new one..."
+                "%s container not found, creating a new one...", self.service_name
             )
             self.create_container()
         else:
             logger.info(
-                f"Found existing {self.service_name} container with id: {container.id}"
+                "Found existing %s container with id: %s",
+                self.service_name,
+                container.id,
             )
             if container.status != "running":
                 container.start()
-                logger.info(f"{self.service_name} container started.")
+                logger.info("%s container started.", self.service_name)
             else:
-                logger.info(f"{self.service_name} container is already running.")
+                logger.info("%s container is already running.", self.service_name)
 
     def stop(self) -> None:
         """
@@ -122,13 +125,14 @@ class ContainerService(Service):
         """
         if self.client is None:
             logger.error(
-                f"Docker client is unavailable. Cannot stop {self.service_name} service."
+                "Docker client is unavailable. Cannot stop %s service.",
+                self.service_name,
             )
             return
 
         container = self.find_container()
         if container and container.status == "running":
             container.stop()
-            logger.info(f"{self.service_name} container stopped.")
+            logger.info("%s container stopped.", self.service_name)
         else:
-            logger.info(f"No running {self.service_name} container found to stop.")
+            logger.info("No running %s container found to stop.", self.service_name)
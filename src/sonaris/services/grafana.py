@@ -6,6 +6,7 @@ from docker.models.containers import Container
 
 from sonaris.defaults import (
     APP_NAME,
+    GF_INSTALL_PLUGINS,
     GF_PROVISIONING_DIR,
     GF_PORT,
     GF_SECURITY_ADMIN_USER,
@@ -17,8 +18,6 @@ from sonaris.utils.log import get_logger
 
 logger = get_logger()
 
-from sonaris.defaults import GF_INSTALL_PLUGINS, GF_PORT, GF_SECURITY_ADMIN_PASSWORD
-
 
 class GrafanaService(ContainerService):
     def __init__(
@@ -39,6 +38,21 @@ class GrafanaService(ContainerService):
         self.plugins = plugins or GF_INSTALL_PLUGINS
         self.port = port or GF_PORT
         self.provisioning_dir = provisioning_dir or GF_PROVISIONING_DIR
+        self._run_kwargs = {
+            "ports": {"3000/tcp": self.port},
+            "environment": {
+                "GF_SECURITY_ADMIN_USER": GF_SECURITY_ADMIN_USER,
+                "GF_SECURITY_ADMIN_PASSWORD": GF_SECURITY_ADMIN_PASSWORD,
+                "GF_INSTALL_PLUGINS": self.plugins,
+            },
+            "volumes": {
+                str(self.provisioning_dir): {
+                    "bind": "/etc/grafana/provisioning",
+                    "mode": "rw",
+                }
+            },
+            "labels": {"grafana": self._container_label},
+        }
 
     def create_container(self, image: str = "grafana/grafana") -> Optional[str]:
         if self.client is None:
@@ -46,28 +60,16 @@ class GrafanaService(ContainerService):
             return None
         try:
             container: Container = self.client.containers.run(
-                image,
-                ports={"3000/tcp": self.port},
-                environment={
-                    "GF_SECURITY_ADMIN_USER": f"{GF_SECURITY_ADMIN_USER}",
-                    "GF_SECURITY_ADMIN_PASSWORD": f"{GF_SECURITY_ADMIN_PASSWORD}",
-                    "GF_INSTALL_PLUGINS": self.plugins,
-                },
-                volumes={
-                    str(self.provisioning_dir): {
-                        "bind": "/etc/grafana/provisioning",
-                        "mode": "rw",
-                    }
-                },
-                labels={f"grafana": self._container_label},
-                detach=True,
+                image, **self._run_kwargs, detach=True
             )
             if self.network:
                 self.network.connect(container)
             logger.info(
-                f"Grafana container created and started. Accessible on http://localhost:{self.port}. (http://host.docker.internal:{self.port} on docker network)"
+                "Grafana container created and started. Accessible on http://localhost:%s. (http://host.docker.internal:%s on docker network)",
+                self.port,
+                self.port,
             )
             return container.id
         except Exception as e:
-            logger.error(f"Failed to create Grafana container: {e}")
+            logger.error("Failed to create Grafana container: %s", e)
             return None
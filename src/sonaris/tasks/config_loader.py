@@ -2,13 +2,15 @@ from typing import Any, Tuple
 
 import yaml
 
+from sonaris.utils.yaml_format import SafeDumper, SafeLoader
+
 
 class ConfigLoader:
     @staticmethod
     def load_config(config_path: str) -> Tuple[bool, str, Any]:
         try:
             with open(config_path, "r") as file:
-                config = yaml.safe_load(file)
+                config = yaml.load(file, Loader=SafeLoader)
                 if not config:
                     return False, "No configuration loaded", None
                 return True, "Configuration loaded successfully", config
@@ -19,7 +21,7 @@ class ConfigLoader:
     def save_config(config: dict, config_path: str) -> Tuple[bool, str]:
         try:
             with open(config_path, "w") as file:
-                yaml.dump(config, file, sort_keys=False)
+                yaml.dump(config, file, Dumper=SafeDumper, sort_keys=False)
             return True, "Configuration saved successfully."
         except Exception as e:
-            return False, f"Failed to save configuration: {str(e)}"
\ No newline at end of file
+            return False, f"Failed to save configuration: {str(e)}"
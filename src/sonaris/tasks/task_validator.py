@@ -1,3 +1,4 @@
+import functools
 import inspect
 import traceback
 from enum import Enum
@@ -11,11 +12,81 @@ from sonaris.utils.log import get_logger
 
 logger = get_logger()
 
+# Types with rules other than a plain isinstance check in Validator.is_type_compatible.
+# Unannotated parameters are treated as str, which accepts anything.
+_TYPE_CHECKERS: Dict[Any, Callable[[Any], bool]] = {
+    # Strict, so that ints are not taken for bools
+    bool: lambda value: isinstance(value, bool),
+    # Allow int values for float parameters
+    float: lambda value: isinstance(value, (int, float)),
+    # Treat everything as compatible with str
+    str: lambda value: True,
+    inspect.Parameter.empty: lambda value: True,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _enum_lookup(task_enum: Enum) -> Dict[str, Enum]:
+    """
+    Maps the upper-cased names and values of an Enum to their members. Where a key matches
+    several members the first one wins, as it would in a scan over the members.
+    """
+    lookup = {}
+    for enum_member in task_enum:
+        lookup.setdefault(str(enum_member.name).upper(), enum_member)
+        lookup.setdefault(str(enum_member.value).upper(), enum_member)
+    return lookup
+
+
+@functools.lru_cache(maxsize=256)
+def task_signature(task_function: Callable) -> inspect.Signature:
+    """
+    Returns the signature of a task function, built once per function since the task
+    functions never change while the application is running.
+    """
+    return inspect.signature(task_function)
+
+
+@functools.lru_cache(maxsize=256)
+def _task_spec(
+    task_function: Callable,
+) -> Tuple[Tuple[Tuple[str, Any, bool], ...], frozenset]:
+    """
+    Reduces the signature of a task function to what parameter validation needs: a
+    (name, annotation, required) entry per parameter in signature order, and the set
+    of parameter names.
+    """
+    parameters = task_signature(task_function).parameters
+    spec = tuple(
+        (name, param.annotation, param.default is inspect.Parameter.empty)
+        for name, param in parameters.items()
+    )
+    return spec, frozenset(parameters)
+
 
 class Validator:
     def __init__(self, task_functions: Dict[str, Callable], task_enum: Optional[Enum]):
         self.task_functions = task_functions
         self.task_enum = task_enum
+        self._function_lookup = self._build_function_lookup()
+
+    def _build_function_lookup(self) -> Dict[str, Callable]:
+        """
+        Resolves every upper-cased task name that get_function_to_validate accepts to its
+        function up front. Direct matches on the task_functions keys take precedence over
+        matches through the Enum names and values.
+        """
+        lookup = {
+            name: function
+            for name, function in self.task_functions.items()
+            if function and name == name.upper()
+        }
+        if self.task_enum:
+            for name, enum_member in _enum_lookup(self.task_enum).items():
+                function = self.task_functions.get(enum_member.value)
+                if function:
+                    lookup.setdefault(name, function)
+        return lookup
 
     def validate_config(
         self, experiment_wrapper: ExperimentWrapper
@@ -42,21 +113,24 @@ class Validator:
         results = []
         for index, task in enumerate(experiment.steps, start=1):
             task_name = task.task.upper()
-            try:
-                task_function = self.get_function_to_validate(task)
-            except Exception as e:
-                logger.error(f"Task function {task_name} failed to load: {e}")
-
+            task_function = self._function_lookup.get(task_name)
             if task_function:
                 is_valid, errors, warnings = self.validate_task_parameters(
                     task_function, task
                 )
                 error_level = ErrorLevel.INFO if is_valid else ErrorLevel.BAD_CONFIG
-                message = " " + "; ".join(errors + warnings)
+                # Clean steps carry no message
+                message = (
+                    " " + "; ".join(errors + warnings) if errors or warnings else ""
+                )
                 results.append(
                     (f"Step {index}: {task_name}", is_valid, message, error_level)
                 )
             else:
+                logger.error(
+                    f"Task function {task_name} failed to load: "
+                    f"{task.task} not found in task_functions dictionary"
+                )
                 results.append(
                     (
                         f"Step {index}: {task_name}",
@@ -69,20 +143,9 @@ class Validator:
 
     def get_function_to_validate(self, task: Task) -> Optional[Callable]:
         """Match the name to a function in task_functions directly or via an Enum."""
-        # Try direct lookup by task name (uppercased) in the task_functions dictionary
-        function_to_validate = self.task_functions.get(task.task.upper())
-
-        # If not found, try to match against Enum names or values
-        if not function_to_validate and self.task_enum:
-            for enum_member in self.task_enum:
-                if (
-                    enum_member.name.upper() == task.task.upper()
-                    or enum_member.value.upper() == task.task.upper()
-                ):
-                    # If a match is found, attempt to get the corresponding function using enum_member's value
-                    function_to_validate = self.task_functions.get(enum_member.value)
-                    if function_to_validate:
-                        return function_to_validate
+        function_to_validate = self._function_lookup.get(task.task.upper())
+        if function_to_validate:
+            return function_to_validate
 
         raise ValueError(f"{task.task} not found in task_functions dictionary")
 
@@ -98,14 +161,7 @@ class Validator:
         Returns:
             True if part of enum.
         """
-        name = name.upper()
-        for enum_member in task_enum:
-            if (
-                str(enum_member.name).upper() == name
-                or str(enum_member.value).upper() == name
-            ):
-                return True
-        return False
+        return name.upper() in _enum_lookup(task_enum)
 
     @staticmethod
     def get_task_enum_value(name: str, task_enum: Enum) -> Optional[Any]:
@@ -119,14 +175,8 @@ class Validator:
         Returns:
             The Enum value if a match is found, None otherwise.
         """
-        name = name.upper()
-        for enum_member in task_enum:
-            if (
-                str(enum_member.name).upper() == name
-                or str(enum_member.value).upper() == name
-            ):
-                return enum_member.value
-        return None
+        enum_member = _enum_lookup(task_enum).get(name.upper())
+        return enum_member.value if enum_member is not None else None
 
     @staticmethod
     def get_task_enum_name(name: str, task_enum: Enum) -> Optional[str]:
@@ -140,14 +190,8 @@ class Validator:
         Returns:
             The Enum name if a match is found, None otherwise.
         """
-        name = name.upper()
-        for enum_member in task_enum:
-            if (
-                str(enum_member.name).upper() == name
-                or str(enum_member.value).upper() == name
-            ):
-                return enum_member.name
-        return None
+        enum_member = _enum_lookup(task_enum).get(name.upper())
+        return enum_member.name if enum_member is not None else None
 
     @staticmethod
     def is_type_compatible(expected_type, value) -> bool:
@@ -159,33 +203,13 @@ class Validator:
         if value is None:
             return True
 
-        # Default unannotated parameters to str
-        if expected_type is inspect.Parameter.empty:
-            expected_type = str
-
-        # Custom handling for bool to ensure strict type matching
-        if expected_type is bool:
-            return isinstance(value, bool)
-
-        # Allow int values for float parameters
-        if expected_type is float and isinstance(value, int):
-            return True
-
-        # Treat everything as compatible with str
-        if expected_type is str:
-            return True
-
-        # Check for direct type compatibility or instance of custom classes
-        if isinstance(value, expected_type):
-            return True
-
-        # Handle complex types like lists, dicts by checking type only (not contents)
-        if expected_type in [list, dict] and type(value) is expected_type:
-            return True
-
-        # Further validation for the contents of lists, dicts, or custom classes could be added here
+        checker = _TYPE_CHECKERS.get(expected_type)
+        if checker is not None:
+            return checker(value)
 
-        return False
+        # Check for direct type compatibility or instance of custom classes, this covers
+        # lists and dicts too (by type only, not contents)
+        return isinstance(value, expected_type)
 
     @staticmethod
     def get_default_value(param_name: str, expected_type: type) -> Any:
@@ -212,44 +236,33 @@ class Validator:
     def validate_task_parameters(
         task_function, task: Task
     ) -> Tuple[bool, List[str], List[str]]:
-        sig = inspect.signature(task_function)
+        spec, names = _task_spec(task_function)
+        parameters = task.parameters
         errors = []
         warnings = []
 
-        for name, param in sig.parameters.items():
-            expected_type = param.annotation
-            provided_value = task.parameters.get(name, inspect.Parameter.empty)
-
+        for name, expected_type, required in spec:
             # Check for missing parameters
-            if provided_value is inspect.Parameter.empty:
-                if param.default is inspect.Parameter.empty:
+            if name not in parameters:
+                if required:
                     errors.append(f"Missing required param: {name}.")
                 else:
                     warnings.append(
                         f"Missing optional param: {name}, using default value."
                     )
-            elif (
-                not Validator.is_type_compatible(expected_type, provided_value)
-                and expected_type is not inspect.Parameter.empty
+                continue
+            provided_value = parameters[name]
+            if (
+                expected_type is not inspect.Parameter.empty
+                and not Validator.is_type_compatible(expected_type, provided_value)
             ):
                 errors.append(
                     f"Type mismatch: {name} (got {type(provided_value).__name__}, expected {expected_type.__name__})"
                 )
 
-        for name in task.parameters:
-            if name not in sig.parameters:
+        for name in parameters:
+            if name not in names:
                 errors.append(f"Extra param provided: {name}.")
 
         is_valid = not errors
         return is_valid, errors, warnings
-
-    def validate_task(task: Task) -> List[Tuple[str, bool, str]]:
-
-        # Use the refactored function to get the function to validate
-        try:
-            function_to_validate = Validator.get_function_to_validate(task)
-        except Exception as e:
-            logger.error(f"Task function failed to load: {e}")
-        if function_to_validate:
-            return True
-        return False
@@ -1,3 +1,4 @@
+import functools
 from datetime import datetime, timedelta
 from enum import Enum
 
@@ -125,18 +126,25 @@ TASK_LIST_DICTIONARY = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _flattened_tasks() -> dict:
+    return {
+        inner_key: value
+        for outer_dict in TASK_LIST_DICTIONARY.values()
+        for inner_key, value in outer_dict.items()
+    }
+
+
 def get_tasks(flatten: bool = False) -> dict:
     """Returns the dict of { device : { task-name : func_pointer , ..} ..}
 
+    Both forms are shared between callers and must be treated as read-only.
+
     Returns:
         dict: dictionary containing devices and its tasks.
     """
     if flatten:
-        return {
-            inner_key: value
-            for outer_dict in TASK_LIST_DICTIONARY.values()
-            for inner_key, value in outer_dict.items()
-        }
+        return _flattened_tasks()
     return TASK_LIST_DICTIONARY
 
 
@@ -1,13 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, NoReturn
+
 import docker
 from docker.errors import APIError, NotFound
 from sonaris.utils.log import get_logger
-from docker.models.containers import Container
-from typing import NoReturn
-from sonaris.utils.log import get_logger
 from sonaris.defaults import SONARIS_NETWORK_NAME
 
 logger = get_logger()
 
+# Upper bound on concurrent requests to the Docker daemon when acting on several containers
+MAX_DOCKER_WORKERS = 8
+
 #================================================================
 
 client = None
@@ -17,24 +20,31 @@ network = None
 if client is None:
     try:
         client = docker.DockerClient.from_env()
-        logger.info(f"Docker client obtained: {client}")
+        logger.info("Docker client obtained: %s", client)
         client.ping()  # Check connection to Docker
     except Exception as e:
-        logger.error(f"Failed to obtain Docker client: {e}")
+        logger.error("Failed to obtain Docker client: %s", e)
         client = None
 
 
-if network is None and client is not None:
-    try:
-        network = client.networks.get(SONARIS_NETWORK_NAME)
-        logger.info(f"Found existing network: {SONARIS_NETWORK_NAME}")
-    except Exception as e:
+def get_network():
+    """
+    Get the sonaris Docker network, creating it on first use.
+    :return: The network, or None if the Docker daemon is unavailable.
+    """
+    global network
+    if network is None and client is not None:
         try:
-            network = client.networks.create(SONARIS_NETWORK_NAME, driver="bridge", check_duplicate=True)
-            logger.info(f"Created new network: {SONARIS_NETWORK_NAME}")
+            network = client.networks.get(SONARIS_NETWORK_NAME)
+            logger.info("Found existing network: %s", SONARIS_NETWORK_NAME)
         except Exception as e:
-            logger.error(f"Failed to create or retrieve network: {e}")
-            network = None
+            try:
+                network = client.networks.create(SONARIS_NETWORK_NAME, driver="bridge", check_duplicate=True)
+                logger.info("Created new network: %s", SONARIS_NETWORK_NAME)
+            except Exception as e:
+                logger.error("Failed to create or retrieve network: %s", e)
+                network = None
+    return network
 
     
 #================================================================
@@ -46,7 +56,7 @@ def list_containers(all: bool = False) -> NoReturn:
     :param all: Whether to show all containers. Defaults to False (show running containers only).
     """
     for container in client.containers.list(all=all):
-        logger.info(f"ID: {container.short_id}, Name: {container.name}, Status: {container.status}")
+        logger.info("ID: %s, Name: %s, Status: %s", container.short_id, container.name, container.status)
 
 def start_container(container_id: str) -> NoReturn:
     """
@@ -54,13 +64,13 @@ def start_container(container_id: str) -> NoReturn:
     :param container_id: ID or name of the container.
     """
     try:
-        container: Container = client.containers.get(container_id)
-        logger.info(f"Starting {container_id}.")
-        container.start()
+        logger.info("Starting %s.", container_id)
+        # The low level API takes the ID or name directly, without inspecting the container first
+        client.api.start(container_id)
     except NotFound:
-        logger.error(f"Container {container_id} not found.")
+        logger.error("Container %s not found.", container_id)
     except APIError as e:
-        logger.error(f"API Error: {e.explanation}")
+        logger.error("API Error: %s", e.explanation)
 
 def stop_container(container_id: str) -> NoReturn:
     """
@@ -68,13 +78,12 @@ def stop_container(container_id: str) -> NoReturn:
     :param container_id: ID or name of the container.
     """
     try:
-        container: Container = client.containers.get(container_id)
-        logger.info(f"Stopping {container_id}.")
-        container.stop()
+        logger.info("Stopping %s.", container_id)
+        client.api.stop(container_id)
     except NotFound:
-        logger.error(f"Container {container_id} not found.")
+        logger.error("Container %s not found.", container_id)
     except APIError as e:
-        logger.error(f"API Error: {e.explanation}")
+        logger.error("API Error: %s", e.explanation)
 
 def remove_container(container_id: str) -> NoReturn:
     """
@@ -82,10 +91,42 @@ def remove_container(container_id: str) -> NoReturn:
     :param container_id: ID or name of the container.
     """
     try:
-        container: Container = client.containers.get(container_id)
-        container.remove()
-        logger.info(f"Container {container_id} removed.")
+        client.api.remove_container(container_id)
+        logger.info("Container %s removed.", container_id)
     except NotFound:
-        logger.error(f"Container {container_id} not found.")
+        logger.error("Container %s not found.", container_id)
     except APIError as e:
-        logger.error(f"API Error: {e.explanation}")
\ No newline at end of file
+        logger.error("API Error: %s", e.explanation)
+
+
+def _for_each_container(action: Callable[[str], None], container_ids: Iterable[str]) -> NoReturn:
+    """
+    Runs a single-container action for every ID concurrently, so the HTTP round-trips to
+    the Docker daemon overlap instead of adding up. Errors are logged per container by the action.
+    """
+    container_ids = list(container_ids)
+    if not container_ids:
+        return
+    with ThreadPoolExecutor(max_workers=min(MAX_DOCKER_WORKERS, len(container_ids))) as executor:
+        list(executor.map(action, container_ids))
+
+def start_containers(container_ids: Iterable[str]) -> NoReturn:
+    """
+    Start several containers at once.
+    :param container_ids: IDs or names of the containers.
+    """
+    _for_each_container(start_container, container_ids)
+
+def stop_containers(container_ids: Iterable[str]) -> NoReturn:
+    """
+    Stop several containers at once.
+    :param container_ids: IDs or names of the containers.
+    """
+    _for_each_container(stop_container, container_ids)
+
+def remove_containers(container_ids: Iterable[str]) -> NoReturn:
+    """
+    Remove several containers at once.
+    :param container_ids: IDs or names of the containers.
+    """
+    _for_each_container(remove_container, container_ids)
@@ -1,26 +1,65 @@
+import atexit
+import functools
 import json
 import logging
+import mmap
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import stat
+import tempfile
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from colorlog import ColoredFormatter
+from filelock import FileLock
 
 from sonaris.defaults import LOG_DIR
 
+try:
+    import orjson
+except ImportError:  # optional, the standard library json is used instead
+    orjson = None
+
 # Global logger variable
 logger = None
 
+# Files at least this large are memory mapped for orjson instead of read into a copy,
+# below it the mapping costs more than it saves
+MMAP_THRESHOLD = 64 * 1024
+
+
+def read_json(path: Path):
+    """
+    Reads and parses a JSON file, with orjson when it is installed. Errors are left to the
+    caller; orjson.JSONDecodeError is a subclass of json.JSONDecodeError.
+    """
+    if orjson is not None:
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < MMAP_THRESHOLD:
+                return orjson.loads(file.read())
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+    with open(path, "r") as file:
+        return json.load(file)
+
 
 def load_json_with_backup(path: Path):
     """
     Attempts to load a JSON file from the given path. If the file is corrupt,
-    it creates a numbered backup and returns an empty dictionary.
+    it creates a numbered backup and returns an empty dictionary. Files too short to hold
+    a JSON object, such as freshly created empty ones, are returned as an empty
+    dictionary without parsing or backing them up.
     """
-    if path.exists():
+    try:
+        size = os.stat(path).st_size
+    except OSError:
+        return {}
+    if size >= 2:
         try:
-            with open(path, "r") as file:
-                return json.load(file)
+            return read_json(path)
         except json.JSONDecodeError as e:
             logger.info(f"Corrupt JSON file detected: {e}. Creating a numbered backup.")
             backup_path = create_numbered_backup(path)
@@ -30,15 +69,102 @@ def load_json_with_backup(path: Path):
     return {}
 
 
-def save_json(data, path: Path):
+def file_mode_for(path: Path) -> int:
     """
-    Saves the given data as a JSON file to the specified path.
+    Returns the permission bits for a file that replaces path: those of path if it
+    exists, otherwise the ones open() would create it with under the current umask.
+    Temporary files are created owner-only, so they are given these before the replace.
     """
     try:
-        with open(path, "w") as file:
-            json.dump(data, file, indent=4)
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def save_json(data, path: Path, durable: bool = False):
+    """
+    Saves the given data as a JSON file to the specified path. The data is written to a
+    temporary file next to it that then replaces the original, so an interrupted write
+    never leaves a truncated file behind. With durable, the data is also flushed to disk
+    before the replace.
+    """
+    tmp_name = None
+    try:
+        # Serialised up front, a value that cannot be encoded then leaves the existing
+        # file alone
+        if orjson is not None:
+            payload = orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            payload = json.dumps(data, indent=4).encode()
+        # A unique temporary file per call, concurrent saves of the same path do not
+        # write into each other's
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+        ) as file:
+            tmp_name = file.name
+            file.write(payload)
+            if durable:
+                file.flush()
+                os.fsync(file.fileno())
+        os.chmod(tmp_name, file_mode_for(path))
+        os.replace(tmp_name, path)
     except Exception as e:
         logger.info(f"Unexpected error loading JSON file: {e}.")
+        if tmp_name is not None and os.path.exists(tmp_name):
+            os.remove(tmp_name)
+
+
+class JsonWriteBuffer:
+    """
+    Holds the latest contents of JSON files in memory and writes them out in the
+    background, at most once per interval and once more when the interpreter exits, so
+    frequently updated state does not hit the disk on every change.
+    """
+
+    def __init__(self, interval: float = 5.0):
+        self.interval = interval
+        self._pending: Dict[Path, Tuple[Any, Optional[Path]]] = {}
+        self._lock = threading.Lock()
+        # Held for a whole flush, so a flush that took an older snapshot of a file cannot
+        # finish after, and overwrite, one that took a newer snapshot
+        self._flush_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        atexit.register(self.flush_all)
+
+    def set(self, path: Path, data, lock_file: Optional[Path] = None) -> None:
+        """
+        Queues data to be written to path, replacing anything queued for it before. The
+        data must not be modified afterwards; pass a copy if the caller keeps using it.
+        If lock_file is given the write happens while holding that file lock.
+        """
+        with self._lock:
+            self._pending[path] = (data, lock_file)
+            if self._timer is None:
+                self._timer = threading.Timer(self.interval, self.flush_all)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush_all(self) -> None:
+        """Writes out everything that is queued."""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            for path, (data, lock_file) in pending.items():
+                if lock_file is None:
+                    save_json(data, path)
+                    continue
+                with FileLock(lock_file, timeout=10):
+                    save_json(data, path)
+
+
+json_write_buffer = JsonWriteBuffer()
 
 
 def create_numbered_backup(original_path: Path):
@@ -46,12 +172,100 @@ def create_numbered_backup(original_path: Path):
     Creates a numbered backup for the given path, ensuring no existing backup is overwritten.
     """
     backup_base = original_path.with_suffix(".bak")
-    counter = 1
-    new_backup = Path(f"{backup_base}_{counter}")
-    while new_backup.exists():
-        counter += 1
-        new_backup = Path(f"{backup_base}_{counter}")
-    return new_backup
+    prefix = f"{backup_base.name}_"
+    # One directory listing instead of a stat per existing backup
+    counter = 0
+    try:
+        with os.scandir(backup_base.parent) as entries:
+            for entry in entries:
+                suffix = entry.name[len(prefix) :]
+                if entry.name.startswith(prefix) and suffix.isdigit():
+                    counter = max(counter, int(suffix))
+    except OSError:
+        pass
+    return Path(f"{backup_base}_{counter + 1}")
+
+
+def create_handlers(logger_name: str) -> List[logging.Handler]:
+    """
+    Creates the file and console handlers of the application logger.
+    """
+    logs_path = LOG_DIR
+    if not logs_path.is_dir():
+        logs_path.mkdir(parents=True, exist_ok=True)
+    log_file_path = logs_path / f"{logger_name}.log"
+    # Handler for writing logs to a file
+    file_handler = RotatingFileHandler(
+        filename=str(log_file_path), maxBytes=10000000, backupCount=5
+    )
+    file_handler.setLevel(logging.DEBUG)
+
+    # Handler for printing logs to the console
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.DEBUG)
+    colored_formatter = ColoredFormatter(
+        "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(module)s.%(funcName)s:\033[97m%(lineno)d\033[0m - %(message)s",
+        datefmt=None,
+        reset=True,
+        log_colors={
+            "DEBUG": "cyan",
+            "INFO": "green",
+            "WARNING": "yellow",
+            "ERROR": "red",
+            "CRITICAL": "red,bg_white",
+        },
+        secondary_log_colors={},
+        style="%",
+    )
+
+    # Adjusted formatter to include module names
+    # formatter = logging.Formatter(
+    #     "%(asctime)s - %(name)s - %(levelname)s - %(module)s.%(funcName)s:%(lineno)d - %(message)s"
+    # )
+
+    file_handler.setFormatter(colored_formatter)
+    console_handler.setFormatter(colored_formatter)
+    return [file_handler, console_handler]
+
+
+class DeferredHandler(logging.Handler):
+    """
+    Stands in for the real handlers until the first record is emitted, so processes that
+    never log do not create the log directory, open the log file or build the formatter.
+    The real handlers then run on a QueueListener thread, logging calls only enqueue the
+    record instead of waiting on the file and terminal writes.
+    """
+
+    _setup_lock = threading.Lock()
+
+    def __init__(self, logger_name: str):
+        super().__init__()
+        self.logger_name = logger_name
+        self.handlers: Optional[List[logging.Handler]] = None
+        self.listener: Optional[QueueListener] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        with self._setup_lock:
+            if self.handlers is None:
+                self.handlers = [self._start_listener()]
+                # Assigned as a new list, Logger.callHandlers may be iterating the old one
+                logging.getLogger(self.logger_name).handlers = list(self.handlers)
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def _start_listener(self) -> QueueHandler:
+        handlers = create_handlers(self.logger_name)
+        records = queue.SimpleQueue()
+        self.listener = QueueListener(records, *handlers, respect_handler_level=True)
+        self.listener.start()
+        atexit.register(self._stop_listener, handlers)
+        return QueueHandler(records)
+
+    def _stop_listener(self, handlers: List[logging.Handler]) -> None:
+        self.listener.stop()
+        # Records logged later during shutdown are written directly
+        logging.getLogger(self.logger_name).handlers = list(handlers)
 
 
 def init_logging(logger_name: str = None):
@@ -60,52 +274,20 @@ def init_logging(logger_name: str = None):
         logger_name = logger_name or "sonaris"
         logger = logging.getLogger(logger_name)
         logger.setLevel(logging.INFO)
-
-        logs_path = LOG_DIR
-        if not logs_path.is_dir():
-            logs_path.mkdir(parents=True, exist_ok=True)
-        log_file_path = logs_path / f"{logger_name}.log"
         logger.propagate = False
-        # Handler for writing logs to a file
-        file_handler = RotatingFileHandler(
-            filename=str(log_file_path), maxBytes=10000000, backupCount=5
-        )
-        file_handler.setLevel(logging.DEBUG)
-
-        # Handler for printing logs to the console
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.DEBUG)
-        colored_formatter = ColoredFormatter(
-            "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(module)s.%(funcName)s:\033[97m%(lineno)d\033[0m - %(message)s",
-            datefmt=None,
-            reset=True,
-            log_colors={
-                "DEBUG": "cyan",
-                "INFO": "green",
-                "WARNING": "yellow",
-                "ERROR": "red",
-                "CRITICAL": "red,bg_white",
-            },
-            secondary_log_colors={},
-            style="%",
-        )
-
-        # Adjusted formatter to include module names
-        # formatter = logging.Formatter(
-        #     "%(asctime)s - %(name)s - %(levelname)s - %(module)s.%(funcName)s:%(lineno)d - %(message)s"
-        # )
-
-        file_handler.setFormatter(colored_formatter)
-        console_handler.setFormatter(colored_formatter)
-
-        # Adding both handlers to the logger
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        # Replaced by the file and console handlers on the first record
+        logger.addHandler(DeferredHandler(logger_name))
+
+
+@functools.lru_cache(maxsize=128)
+def _module_logger(prefix: str, module_name: str) -> logging.Logger:
+    return logging.getLogger(f"{prefix}.{module_name}")
 
 
 def get_logger(module_name=None):
     if logger is None:
         init_logging()
     if module_name:
-        return logging.getLogger(f"{os.getenv('LOGGER_NAME', 'logs')}.{module_name}")
+        # LOGGER_NAME is still read per call, it may only be set once .env is loaded
+        return _module_logger(os.getenv("LOGGER_NAME", "logs"), module_name)
     return logger
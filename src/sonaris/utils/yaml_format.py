@@ -0,0 +1,161 @@
+import copy
+import functools
+import hashlib
+import math
+import os
+import pickle  # nosec B403
+import re
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from sonaris.defaults import CACHE_DIR
+from sonaris.utils.log import file_mode_for, get_logger
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
+logger = get_logger()
+
+if not yaml.__with_libyaml__:
+    logger.warning(
+        "PyYAML is installed without libyaml, YAML is parsed with the slower pure Python "
+        "implementation. Reinstall PyYAML with libyaml available to speed this up."
+    )
+
+YAML_WIDTH = 80
+
+# Strings matching this are emitted by yaml.dump without quotes, given they do not
+# resolve to another implicit type (bool, int, null, ...).
+_PLAIN_SCALAR = re.compile(r"[A-Za-z_][\w.()/-]*(?: [\w.()/-]+)*", re.ASCII)
+_RESOLVER = yaml.resolver.Resolver()
+_STR_TAG = "tag:yaml.org,2002:str"
+
+
+def format_scalar(value: Any) -> str | None:
+    """
+    Formats a scalar exactly as yaml.dump would, or returns None when it cannot guarantee that.
+    """
+    value_type = type(value)
+    if value is None:
+        return "null"
+    if value_type is bool:
+        return "true" if value else "false"
+    if value_type is int:
+        return str(value)
+    if value_type is float:
+        if math.isnan(value):
+            return ".nan"
+        if math.isinf(value):
+            return ".inf" if value > 0 else "-.inf"
+        text = repr(value).lower()
+        if "." not in text and "e" in text:
+            text = text.replace("e", ".0e", 1)
+        return text
+    if value_type is str and _PLAIN_SCALAR.fullmatch(value):
+        if _RESOLVER.resolve(yaml.ScalarNode, value, (True, False)) == _STR_TAG:
+            return value
+        return f"'{value}'"
+    return None
+
+
+def format_mapping(mapping: dict, indent: str = "", nested: bool = True) -> list | None:
+    """
+    Formats a mapping of scalars (optionally one level of nested mappings) into block style
+    YAML lines. Returns None if any key or value cannot be formatted exactly, or if a line
+    would exceed the width at which yaml.dump starts folding.
+    """
+    lines = []
+    for key, value in mapping.items():
+        key_text = format_scalar(key) if type(key) is str else None
+        if key_text is None:
+            return None
+        if type(value) is dict and value and nested:
+            children = format_mapping(value, indent + "  ", nested=False)
+            if children is None:
+                return None
+            lines.append(f"{indent}{key_text}:")
+            lines.extend(children)
+            continue
+        value_text = "{}" if type(value) is dict and not value else format_scalar(value)
+        if value_text is None:
+            return None
+        line = f"{indent}{key_text}: {value_text}"
+        if len(line) > YAML_WIDTH:
+            return None
+        lines.append(line)
+    return lines
+
+
+def dump_mapping(mapping: dict, **kwargs) -> str:
+    """
+    Emits a flat mapping (such as a single experiment step) as YAML without going through
+    the yaml serializer, producing the same text as yaml.dump(mapping, sort_keys=False).
+    Anything outside the fast path falls back to yaml.dump with the given keyword arguments.
+    """
+    lines = format_mapping(mapping)
+    if lines is None:
+        return yaml.dump(mapping, Dumper=SafeDumper, sort_keys=False, **kwargs)
+    return "\n".join(lines) + "\n"
+
+
+def _sidecar_path(path: str) -> Path:
+    digest = hashlib.sha1(
+        os.path.abspath(path).encode(), usedforsecurity=False
+    ).hexdigest()
+    return CACHE_DIR / f"{digest}.pkl"
+
+
+def _write_sidecar(sidecar: Path, mtime_ns: int, data: Any) -> None:
+    tmp_name = None
+    try:
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=sidecar.parent, suffix=".tmp", delete=False
+        ) as file:
+            tmp_name = file.name
+            pickle.dump((mtime_ns, data), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.chmod(tmp_name, file_mode_for(sidecar))
+        os.replace(tmp_name, sidecar)
+    except OSError as e:
+        logger.warning(f"Could not write YAML cache {sidecar}: {e}")
+        if tmp_name is not None and os.path.exists(tmp_name):
+            os.remove(tmp_name)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int) -> Any:
+    # A pickled copy of the parsed file is kept under CACHE_DIR, tagged with the
+    # modification time it was parsed at, so later runs can skip the YAML parser
+    sidecar = _sidecar_path(path)
+    try:
+        with open(sidecar, "rb") as file:
+            # The sidecar is written by this module under the app's own data directory
+            # and keyed by the source path and mtime, it is not untrusted input
+            cached_mtime_ns, data = pickle.load(file)  # nosec B301
+        if cached_mtime_ns == mtime_ns:
+            return data
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.info(f"Ignoring unreadable YAML cache {sidecar}: {e}")
+
+    with open(path, "r") as file:
+        data = yaml.load(file, Loader=SafeLoader)
+    _write_sidecar(sidecar, mtime_ns, data)
+    return data
+
+
+def load_yaml(path: str) -> Any:
+    """
+    Loads a YAML file, reusing the parsed result (in memory, and across runs through a
+    pickle under CACHE_DIR) while the file's modification time is unchanged. Callers get
+    their own copy, so they are free to modify it.
+    """
+    path = os.fspath(path)
+    return copy.deepcopy(_load_yaml_cached(path, os.stat(path).st_mtime_ns))
@@ -58,3 +58,61 @@ def test_detect_device_with_no_device(mock_resource_manager):
 
     # Ensure that the detection result is None when no devices are found
     assert result is None
+
+
+def test_detect_device_probes_all_resources_and_remembers_match(tmp_path):
+    cache = tmp_path / "resources.json"
+    devices = {
+        "TCPIP0::192.168.1.100::INSTR": Mock(**{"query.return_value": "Other,Model"}),
+        "USB0::0x1234::0x5678::SN12345::0::INSTR": Mock(
+            **{"query.return_value": "Manufacturer,Generic Device ID,Serial,Version"}
+        ),
+        "ASRL1::INSTR": Mock(),
+    }
+    mock_rm = Mock()
+    mock_rm.list_resources.return_value = tuple(devices)
+    mock_rm.open_resource.side_effect = devices.__getitem__
+
+    result = DeviceDetector(
+        mock_rm, GenericDevice, resource_cache=cache
+    ).detect_device()
+
+    assert isinstance(result.interface, USBInterface)
+    devices["ASRL1::INSTR"].query.assert_not_called()
+    # The session that did not match is closed, the matching one is kept open
+    devices["TCPIP0::192.168.1.100::INSTR"].close.assert_called_once()
+    devices["USB0::0x1234::0x5678::SN12345::0::INSTR"].close.assert_not_called()
+
+    # The next detection only needs to open the remembered resource, without a scan
+    mock_rm.open_resource.reset_mock()
+    mock_rm.list_resources.reset_mock()
+    result = DeviceDetector(
+        mock_rm, GenericDevice, resource_cache=cache
+    ).detect_device()
+
+    assert isinstance(result.interface, USBInterface)
+    mock_rm.open_resource.assert_called_once_with(
+        "USB0::0x1234::0x5678::SN12345::0::INSTR"
+    )
+    mock_rm.list_resources.assert_not_called()
+
+
+def test_detect_device_closes_matches_it_does_not_use():
+    devices = {
+        f"TCPIP0::192.168.1.{i}::INSTR": Mock(
+            resource_name=f"TCPIP0::192.168.1.{i}::INSTR",
+            **{"query.return_value": "Manufacturer,Generic Device ID,Serial,Version"},
+        )
+        for i in range(4)
+    }
+    mock_rm = Mock()
+    mock_rm.list_resources.return_value = tuple(devices)
+    mock_rm.open_resource.side_effect = devices.__getitem__
+
+    result = DeviceDetector(mock_rm, GenericDevice).detect_device()
+
+    used = [device for device in devices.values() if device is result.interface.inst]
+    assert len(used) == 1
+    for device in devices.values():
+        if device is not used[0]:
+            assert device.close.call_count == (1 if device.query.called else 0)
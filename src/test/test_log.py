@@ -0,0 +1,152 @@
+import atexit
+import logging
+import os
+import threading
+from logging.handlers import QueueHandler
+
+import pytest
+
+from sonaris.utils import log as logutils
+
+
+@pytest.fixture(params=["orjson", "orjson-mmap", "json"])
+def json_backend(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(logutils, "orjson", None)
+    elif logutils.orjson is None:
+        pytest.skip("orjson is not installed")
+    elif request.param == "orjson-mmap":
+        monkeypatch.setattr(logutils, "MMAP_THRESHOLD", 1)
+    return request.param
+
+
+def test_save_and_load_json(tmp_path, json_backend):
+    path = tmp_path / "state.json"
+    data = {"jobs": [{"id": "a", "kwargs": {"channel": 1, "output": True}}], "x": 1.5}
+    logutils.save_json(data, path)
+    assert logutils.load_json_with_backup(path) == data
+    logutils.save_json(data, path, durable=True)
+    assert logutils.load_json_with_backup(path) == data
+
+
+def test_load_json_backs_up_corrupt_file(tmp_path, json_backend):
+    logutils.get_logger()
+    path = tmp_path / "state.json"
+    path.write_text('{"jobs": [')
+    assert logutils.load_json_with_backup(path) == {}
+    assert not path.exists()
+    assert (tmp_path / "state.bak_1").read_text() == '{"jobs": ['
+
+
+def test_load_json_empty_file_is_not_backed_up(tmp_path, json_backend):
+    path = tmp_path / "state.json"
+    path.touch()
+    assert logutils.load_json_with_backup(path) == {}
+    assert path.exists()
+    assert not (tmp_path / "state.bak_1").exists()
+
+
+def test_load_json_missing_file(tmp_path, json_backend):
+    assert logutils.load_json_with_backup(tmp_path / "missing.json") == {}
+
+
+def test_save_json_keeps_file_on_encoding_error(tmp_path, json_backend):
+    logutils.get_logger()
+    path = tmp_path / "state.json"
+    logutils.save_json({"a": 1}, path)
+    logutils.save_json({"a": object()}, path)
+    assert logutils.load_json_with_backup(path) == {"a": 1}
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+
+def test_save_json_keeps_file_mode(tmp_path, json_backend):
+    path = tmp_path / "state.json"
+    umask = os.umask(0o022)
+    try:
+        logutils.save_json({"a": 1}, path)
+    finally:
+        os.umask(umask)
+    assert path.stat().st_mode & 0o777 == 0o644
+    path.chmod(0o640)
+    logutils.save_json({"a": 2}, path)
+    assert path.stat().st_mode & 0o777 == 0o640
+
+
+def test_concurrent_saves_of_one_file(tmp_path, json_backend):
+    path = tmp_path / "state.json"
+    data = [{"writer": i, "values": list(range(1000))} for i in range(8)]
+    writers = [
+        threading.Thread(target=logutils.save_json, args=(d, path)) for d in data
+    ]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+    assert logutils.load_json_with_backup(path) in data
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+
+def test_json_write_buffer_batches_writes(tmp_path):
+    buffer = logutils.JsonWriteBuffer(interval=60)
+    path = tmp_path / "state.json"
+    buffer.set(path, {"a": 1})
+    buffer.set(path, {"a": 2}, lock_file=tmp_path / "state.lock")
+    assert not path.exists()
+    buffer.flush_all()
+    assert logutils.load_json_with_backup(path) == {"a": 2}
+
+
+def test_json_write_buffer_flushes_in_order(tmp_path, monkeypatch):
+    buffer = logutils.JsonWriteBuffer(interval=60)
+    path = tmp_path / "state.json"
+    save_json = logutils.save_json
+    first_write_started = threading.Event()
+
+    def slow_first_save(data, path):
+        if not first_write_started.is_set():
+            first_write_started.set()
+            # Gives a concurrent flush the chance to finish first
+            threading.Event().wait(0.2)
+        save_json(data, path)
+
+    monkeypatch.setattr(logutils, "save_json", slow_first_save)
+    buffer.set(path, {"a": 1})
+    older_flush = threading.Thread(target=buffer.flush_all)
+    older_flush.start()
+    first_write_started.wait()
+    buffer.set(path, {"a": 2})
+    buffer.flush_all()
+    older_flush.join()
+    assert logutils.load_json_with_backup(path) == {"a": 2}
+
+
+def test_create_numbered_backup_follows_highest_backup(tmp_path):
+    path = tmp_path / "state.json"
+    assert logutils.create_numbered_backup(path) == tmp_path / "state.bak_1"
+    for name in ("state.bak_1", "state.bak_3", "state.bak_x", "other.bak_9"):
+        (tmp_path / name).touch()
+    assert logutils.create_numbered_backup(path) == tmp_path / "state.bak_4"
+
+
+def test_deferred_handler_logs_through_queue(monkeypatch):
+    class Collector(logging.Handler):
+        def __init__(self):
+            super().__init__()
+            self.messages = []
+
+        def emit(self, record):
+            self.messages.append(record.getMessage())
+
+    collector = Collector()
+    monkeypatch.setattr(logutils, "create_handlers", lambda name: [collector])
+    test_logger = logging.getLogger("test_deferred_handler")
+    test_logger.propagate = False
+    deferred = logutils.DeferredHandler("test_deferred_handler")
+    test_logger.addHandler(deferred)
+
+    test_logger.warning("first %s", 1)
+    test_logger.warning("second")
+    atexit.unregister(deferred._stop_listener)
+    deferred.listener.stop()
+    assert collector.messages == ["first 1", "second"]
+    assert [type(h) for h in test_logger.handlers] == [QueueHandler]
@@ -0,0 +1,93 @@
+from enum import Enum
+
+import pytest
+
+from sonaris.tasks.model import Task
+from sonaris.tasks.task_validator import Validator
+
+
+class Overlapping(Enum):
+    FIRST = "second"
+    SECOND = "Other Value"
+
+
+@pytest.mark.parametrize(
+    "name, expected_name, expected_value",
+    [
+        ("FIRST", "FIRST", "second"),
+        ("other value", "SECOND", "Other Value"),
+        # Value of FIRST and name of SECOND, the first member in definition order wins
+        ("Second", "FIRST", "second"),
+        ("missing", None, None),
+    ],
+)
+def test_enum_lookups(name, expected_name, expected_value):
+    assert Validator.get_task_enum_name(name, Overlapping) == expected_name
+    assert Validator.get_task_enum_value(name, Overlapping) == expected_value
+    assert Validator.is_in_enum(name, Overlapping) is (expected_name is not None)
+
+
+def task_first():
+    return True
+
+
+def task_second():
+    return True
+
+
+TASK_FUNCTIONS = {
+    "DIRECT": task_first,
+    "second": task_first,
+    "Other Value": task_second,
+}
+
+
+@pytest.mark.parametrize(
+    "task_name, expected",
+    [
+        ("direct", task_first),  # upper-cased key in task_functions
+        ("first", task_first),  # enum name
+        ("other value", task_second),  # enum value
+        ("SECOND", task_first),  # FIRST by value comes before SECOND by name
+    ],
+)
+def test_get_function_to_validate(task_name, expected):
+    validator = Validator(TASK_FUNCTIONS, Overlapping)
+    assert validator.get_function_to_validate(Task(task=task_name)) is expected
+
+
+def test_get_function_to_validate_unknown_task():
+    validator = Validator(TASK_FUNCTIONS, Overlapping)
+    with pytest.raises(ValueError):
+        validator.get_function_to_validate(Task(task="missing"))
+
+
+def task_with_params(channel: int, amplitude: float, label="", output: bool = False):
+    return True
+
+
+def test_validate_task_parameters():
+    task = Task(
+        task="direct",
+        parameters={"amplitude": 1, "output": "on", "extra": 0, "label": None},
+    )
+    is_valid, errors, warnings = Validator.validate_task_parameters(
+        task_with_params, task
+    )
+    assert not is_valid
+    assert errors == [
+        "Missing required param: channel.",
+        "Type mismatch: output (got str, expected bool)",
+        "Extra param provided: extra.",
+    ]
+    assert warnings == []
+
+    task = Task(task="direct", parameters={"channel": 1, "amplitude": 2.5})
+    assert Validator.validate_task_parameters(task_with_params, task) == (
+        True,
+        [],
+        [
+            "Missing optional param: label, using default value.",
+            "Missing optional param: output, using default value.",
+        ],
+    )
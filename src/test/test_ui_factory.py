@@ -118,3 +118,20 @@ class TestUIComponentFactory:
         # Test Case: Handling default values
         int_widget = UIComponentFactory.create_widget("int_param", 10, int, None)
         assert int_widget.value() == 10
+
+    def test_create_widget_shared_shape_returns_fresh_widgets(self):
+        # Test Case: Widgets built from a cached (type, constraints) shape are distinct instances
+        first = UIComponentFactory.create_widget("channel", 1, int, [1, 2])
+        second = UIComponentFactory.create_widget("channel", 2, int, [1, 2])
+        assert first is not second
+        assert UIComponentFactory.extract_value(first) == 1
+        assert UIComponentFactory.extract_value(second) == 2
+
+    def test_create_widget_constraints_keyed_by_value_type(self):
+        # Test Case: Equal-comparing constraints of different types do not share a builder
+        int_widget = UIComponentFactory.create_widget("int_param", None, int, [1, 0])
+        bool_widget = UIComponentFactory.create_widget(
+            "bool_param", None, int, [True, False]
+        )
+        assert int_widget.itemText(0) == "1"
+        assert bool_widget.itemText(0) == "True"
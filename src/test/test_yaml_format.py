@@ -0,0 +1,74 @@
+import os
+
+import pytest
+import yaml
+
+from sonaris.utils import yaml_format
+from sonaris.utils.yaml_format import dump_mapping, load_yaml
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(yaml_format, "CACHE_DIR", tmp_path / "cache")
+    return tmp_path / "cache"
+
+
+@pytest.mark.parametrize(
+    "step",
+    [
+        {
+            "task": "DG4202_SET_WAVEFORM",
+            "description": "This will run in 5 seconds",
+            "delay": 5.0,
+            "parameters": {
+                "channel": 1,
+                "send_on": True,
+                "waveform_type": "PULSE",
+                "amplitude": 2.5,
+                "frequency": 1e-05,
+                "offset": 0.0,
+            },
+        },
+        {
+            "task": "DG4202_TOGGLE",
+            "description": None,
+            "delay": 0.0,
+            "parameters": {"channel": 2, "output": "ON"},
+        },
+        {"task": "EDUX1002A_AUTO", "description": None, "delay": 0.0, "parameters": {}},
+        # Values outside the fast path fall back to yaml.dump
+        {
+            "task": "DG4202_TOGGLE",
+            "description": "Multi: line\ndescription",
+            "delay": float("inf"),
+            "parameters": {"channels": [1, 2], "output": "1.5"},
+        },
+    ],
+)
+def test_dump_mapping_matches_yaml_dump(step):
+    assert dump_mapping(step) == yaml.dump(step, sort_keys=False)
+
+
+def test_load_yaml_reloads_modified_file(tmp_path, cache_dir):
+    config = tmp_path / "experiment.yaml"
+    config.write_text("experiment:\n  name: first\n")
+    loaded = load_yaml(config)
+    loaded["experiment"]["name"] = "changed by caller"
+    assert load_yaml(config) == {"experiment": {"name": "first"}}
+
+    config.write_text("experiment:\n  name: second\n")
+    stat = config.stat()
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_yaml(config) == {"experiment": {"name": "second"}}
+
+
+def test_load_yaml_reads_pickle_cache_across_runs(tmp_path, cache_dir, monkeypatch):
+    config = tmp_path / "experiment.yaml"
+    config.write_text("experiment:\n  name: cached\n")
+    assert load_yaml(config) == {"experiment": {"name": "cached"}}
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+    # A new run starts with an empty in-memory cache and must not parse the file again
+    yaml_format._load_yaml_cached.cache_clear()
+    monkeypatch.setattr(yaml, "load", None)
+    assert load_yaml(config) == {"experiment": {"name": "cached"}}